@@ -2,6 +2,8 @@
 Colonie-IA Backend Application
 Flask application factory
 """
+import logging
+
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
@@ -12,8 +14,9 @@ from flask_limiter.util import get_remote_address
 from flasgger import Swagger
 
 from app.config import config
+from app.utils.replica import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 migrate = Migrate()
 socketio = SocketIO()
 limiter = Limiter(key_func=get_remote_address)
@@ -25,10 +28,33 @@ def create_app(config_name: str = "development") -> Flask:
     app = Flask(__name__)
     app.config.from_object(config[config_name])
 
+    # orjson for jsonify(), request.get_json() and Socket.IO packets
+    from app.utils.json_provider import ORJSONCodec, ORJSONProvider
+    app.json = ORJSONProvider(app)
+    # Dicts are built in a meaningful order already: skip sorting every
+    # response, and never indent it, even in debug (Flask 3 replacements for
+    # JSON_SORT_KEYS / JSONIFY_PRETTYPRINT_REGULAR)
+    app.json.sort_keys = False
+    app.json.compact = True
+
+    # Below this level, records are dropped before any formatting
+    if app.config.get("LOG_LEVEL"):
+        logging.getLogger().setLevel(app.config["LOG_LEVEL"])
+        app.logger.setLevel(app.config["LOG_LEVEL"])
+
+    # Log I/O off the request threads
+    if app.config.get("LOG_QUEUE"):
+        from app.utils.log_queue import init_log_queue
+        init_log_queue(app)
+
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
 
+    # Optional Redis cache
+    from app.utils.cache import init_cache
+    init_cache(app)
+
     # Only enable rate limiter if configured
     if app.config.get("RATELIMIT_ENABLED", True):
         limiter.init_app(app)
@@ -49,6 +75,7 @@ def create_app(config_name: str = "development") -> Flask:
         app,
         cors_allowed_origins=cors_origins,
         async_mode="threading",
+        json=ORJSONCodec,
     )
 
     # Swagger/OpenAPI configuration
@@ -5,6 +5,24 @@ import os
 from datetime import timedelta
 
 
+# Pool de connexions PostgreSQL (staging/prod) : chaque requête garde sa
+# connexion jusqu'au teardown, le pool par défaut (5) sature en rafale
+POOLED_ENGINE_OPTIONS = {
+    "pool_size": int(os.environ.get("DB_POOL_SIZE", 20)),
+    "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 40)),
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+
+def read_replica_binds() -> dict:
+    """Bind du réplica en lecture (DATABASE_READ_URL), avec son propre pool."""
+    url = os.environ.get("DATABASE_READ_URL")
+    if not url:
+        return {}
+    return {"read_replica": {"url": url, **POOLED_ENGINE_OPTIONS}}
+
+
 class Config:
     """Configuration de base."""
 
@@ -21,6 +39,17 @@ class Config:
     # CORS
     CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "http://localhost:5173").split(",")
 
+    # Redis cache (disabled when unset, see app.utils.cache)
+    REDIS_URL = os.environ.get("REDIS_URL")
+
+    # Fail on lazy loads not declared by route queries (see app.utils.loading)
+    STRICT_LOADING = False
+
+    # Write logs from a background thread (see app.utils.log_queue)
+    LOG_QUEUE = False
+    # Niveau de log global (None : réglages par défaut de logging/Flask)
+    LOG_LEVEL = os.environ.get("LOG_LEVEL")
+
     # Rate limiting
     RATELIMIT_ENABLED = True
     RATELIMIT_DEFAULT = "100/minute"
@@ -48,6 +77,7 @@ class DevelopmentConfig(Config):
     )
     # Disable rate limiting in development
     RATELIMIT_ENABLED = False
+    STRICT_LOADING = True
 
 
 class StagingConfig(Config):
@@ -55,6 +85,9 @@ class StagingConfig(Config):
 
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
+    SQLALCHEMY_ENGINE_OPTIONS = POOLED_ENGINE_OPTIONS
+    SQLALCHEMY_BINDS = read_replica_binds()
+    LOG_QUEUE = True
 
     # CORS plus restrictif
     CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "").split(",")
@@ -65,6 +98,11 @@ class ProductionConfig(Config):
 
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
+    SQLALCHEMY_ENGINE_OPTIONS = POOLED_ENGINE_OPTIONS
+    SQLALCHEMY_BINDS = read_replica_binds()
+    LOG_QUEUE = True
+    # Les logs info/debug ne sont ni formatés ni écrits
+    LOG_LEVEL = os.environ.get("LOG_LEVEL", "WARNING")
 
     # Sécurité renforcée
     SESSION_COOKIE_SECURE = True
@@ -86,7 +124,9 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    REDIS_URL = None
     RATELIMIT_ENABLED = False
+    STRICT_LOADING = True
 
 
 config = {
@@ -1,6 +1,7 @@
 """
 Napoleonic-themed names for planets, stars, and AI players.
 """
+import random
 
 # Star/System names - Major Napoleonic battles and locations
 STAR_NAMES = [
@@ -290,7 +291,6 @@ EASTER_EGG_DATES = {
 
 def get_random_star_name(used_names: set[str] | None = None) -> str:
     """Get a random unused star name."""
-    import random
     available = [name for name in STAR_NAMES if used_names is None or name not in used_names]
     if not available:
         # Generate a numbered name if all are used
@@ -300,7 +300,6 @@ def get_random_star_name(used_names: set[str] | None = None) -> str:
 
 def get_random_hostile_name(used_names: set[str] | None = None) -> str:
     """Get a random unused hostile planet name (barbaric/strange)."""
-    import random
     available = [name for name in HOSTILE_PLANET_NAMES if used_names is None or name not in used_names]
     if not available:
         # Generate a procedural barbaric name if all are used
@@ -312,7 +311,6 @@ def get_random_hostile_name(used_names: set[str] | None = None) -> str:
 
 def get_random_ai_name(used_names: set[str] | None = None) -> str:
     """Get a random unused AI name."""
-    import random
     available = [name for name in AI_NAMES if used_names is None or name not in used_names]
     if not available:
         # Generate a numbered name if all are used
@@ -377,7 +375,6 @@ def generate_planet_history(temperature: float, gravity: float, metal_reserves:
     Returns:
         Tuple of (line1, line2) describing the planet's history
     """
-    import random
 
     lines = []
 
@@ -2,12 +2,14 @@
 Database models
 """
 from app.models.user import User
-from app.models.galaxy import Galaxy, Planet, GalaxyShape, GalaxyDensity, PlanetState
+from app.models.galaxy import (
+    Galaxy, Planet, GalaxyShape, GalaxyDensity, PlanetState, OWNED_PLANET_STATES,
+)
 from app.models.game import Game, GamePlayer, GameStatus, AIDifficulty
 from app.models.fleet import (
     Ship, ShipDesign, Fleet, ProductionQueue,
     ShipType, FleetStatus, CombatBehavior,
-    SHIP_BASE_STATS,
+    SHIP_BASE_STATS, DISBAND_METAL_RECOVERY, TANKER_RANGE_BONUS,
 )
 from app.models.technology import (
     PlayerTechnology, RadicalBreakthrough,
@@ -26,6 +28,7 @@ __all__ = [
     "GalaxyShape",
     "GalaxyDensity",
     "PlanetState",
+    "OWNED_PLANET_STATES",
     "Ship",
     "ShipDesign",
     "Fleet",
@@ -34,6 +37,8 @@ __all__ = [
     "FleetStatus",
     "CombatBehavior",
     "SHIP_BASE_STATS",
+    "DISBAND_METAL_RECOVERY",
+    "TANKER_RANGE_BONUS",
     "PlayerTechnology",
     "RadicalBreakthrough",
     "TechDomain",
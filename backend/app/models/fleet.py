@@ -3,8 +3,12 @@ Fleet and Ship models for the space fleet system.
 """
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import List, Optional
 
+from sqlalchemy import Integer, cast, func
+from sqlalchemy.ext.hybrid import hybrid_property
+
 from app import db
 
 
@@ -120,6 +124,9 @@ SHIP_BASE_STATS = {
     },
 }
 
+DISBAND_METAL_RECOVERY = 0.75  # 75% metal recovered when disbanding
+TANKER_RANGE_BONUS = 1.5  # Tankers extend fleet range by 50%
+
 
 # =============================================================================
 # ShipDesign Model
@@ -157,17 +164,23 @@ class ShipDesign(db.Model):
 
     # Relationships
     player = db.relationship("GamePlayer", backref=db.backref("ship_designs", lazy="dynamic"))
-    ships = db.relationship("Ship", backref="design", lazy="dynamic")
+    # Ships are never used without their design: load it in the same query
+    ships = db.relationship("Ship", backref=db.backref("design", lazy="joined", innerjoin=True),
+                            lazy="dynamic")
 
     def __repr__(self):
         return f"<ShipDesign {self.name} ({self.ship_type})>"
 
-    @property
+    # A design's type and levels are fixed when it is created, so the
+    # derived stats below are computed once per loaded instance instead of
+    # on every access (they are read per ship when serializing fleets)
+
+    @cached_property
     def base_stats(self):
         """Get base stats for this ship type."""
         return SHIP_BASE_STATS.get(ShipType(self.ship_type), SHIP_BASE_STATS[ShipType.FIGHTER])
 
-    @property
+    @cached_property
     def effective_range(self) -> float:
         """Calculate effective range based on tech level and ship type."""
         base = self.base_stats
@@ -176,24 +189,40 @@ class ShipDesign(db.Model):
         # in a 140x140 galaxy where average neighbor distance is ~30 units
         return (self.range_level * 35) + base["range_bonus"]
 
-    @property
+    @cached_property
     def effective_speed(self) -> float:
         """Calculate effective speed based on tech level and ship type."""
         base = self.base_stats
         return self.speed_level * base["speed_mult"]
 
-    @property
+    @cached_property
     def effective_weapons(self) -> float:
         """Calculate effective weapons based on tech level and ship type."""
         base = self.base_stats
         return self.weapons_level * base["weapons_mult"]
 
-    @property
+    @cached_property
     def effective_shields(self) -> float:
         """Calculate effective shields based on tech level and ship type."""
         base = self.base_stats
         return self.shields_level * base["shields_mult"]
 
+    def health_percent_for(self, damage: int) -> float:
+        """Health percentage of a ship of this design with the given damage."""
+        max_health = self.effective_shields * 10
+        current_health = max(0, max_health - damage)
+        return (current_health / max_health) * 100 if max_health > 0 else 0
+
+    @hybrid_property
+    def scrap_value(self) -> int:
+        """Metal recovered when disbanding a ship of this design."""
+        return int(self.production_cost_metal * DISBAND_METAL_RECOVERY)
+
+    @scrap_value.expression
+    def scrap_value(cls):
+        # floor() first: CAST rounds on PostgreSQL where int() truncates
+        return cast(func.floor(cls.production_cost_metal * DISBAND_METAL_RECOVERY), Integer)
+
     def calculate_costs(self):
         """Calculate and cache production costs."""
         base = self.base_stats
@@ -286,12 +315,17 @@ class Fleet(db.Model):
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        # Stationed fleets of a player at a planet
+        db.Index("ix_fleets_player_planet_status", "player_id", "current_planet_id", "status"),
+    )
+
     # Relationships
     player = db.relationship("GamePlayer", backref=db.backref("fleets", lazy="dynamic"))
     current_planet = db.relationship("Planet", foreign_keys=[current_planet_id],
                                      backref=db.backref("stationed_fleets", lazy="dynamic"))
     destination_planet = db.relationship("Planet", foreign_keys=[destination_planet_id])
-    ships = db.relationship("Ship", backref="fleet", lazy="dynamic")
+    ships = db.relationship("Ship", back_populates="fleet", lazy="selectin", order_by="Ship.id")
 
     def __repr__(self):
         return f"<Fleet {self.name} ({self.ship_count} ships)>"
@@ -299,67 +333,85 @@ class Fleet(db.Model):
     @property
     def ship_count(self) -> int:
         """Number of ships in the fleet."""
-        return self.ships.filter_by(is_destroyed=False).count()
+        return len(self.active_ships())
 
     @property
     def is_empty(self) -> bool:
         """Check if fleet has no active ships."""
         return self.ship_count == 0
 
+    def active_ships(self) -> List["Ship"]:
+        """Ships not destroyed (a new list, safe to iterate while moving ships)."""
+        return [ship for ship in self.ships if not ship.is_destroyed]
+
     @property
     def fleet_speed(self) -> float:
         """Fleet speed is limited by slowest ship."""
-        ships = self.ships.filter_by(is_destroyed=False).all()
-        if not ships:
-            return 0
-        return min(ship.design.effective_speed for ship in ships)
+        return self._stats_of(self.active_ships())["fleet_speed"]
 
     @property
     def fleet_range(self) -> float:
         """Fleet range is limited by shortest-range ship."""
-        ships = self.ships.filter_by(is_destroyed=False).all()
-        if not ships:
-            return 0
-
-        base_range = min(ship.design.effective_range for ship in ships)
-
-        # Tanker bonus: extends range by 50%
-        has_tanker = any(ship.design.ship_type == ShipType.TANKER.value for ship in ships)
-        if has_tanker:
-            return base_range * 1.5
-
-        return base_range
+        return self._stats_of(self.active_ships())["fleet_range"]
 
     @property
     def total_weapons(self) -> float:
         """Total fleet weapons power."""
-        ships = self.ships.filter_by(is_destroyed=False).all()
-        return sum(ship.design.effective_weapons for ship in ships)
+        return self._stats_of(self.active_ships())["total_weapons"]
 
     @property
     def total_shields(self) -> float:
         """Total fleet shields."""
-        ships = self.ships.filter_by(is_destroyed=False).all()
-        return sum(ship.design.effective_shields for ship in ships)
+        return self._stats_of(self.active_ships())["total_shields"]
 
     @property
     def can_colonize(self) -> bool:
         """Check if fleet has a colony ship."""
-        return self.ships.filter_by(is_destroyed=False).join(ShipDesign).filter(
-            ShipDesign.ship_type == ShipType.COLONY.value
-        ).count() > 0
+        return self._stats_of(self.active_ships())["can_colonize"]
 
     def get_ships_by_type(self) -> dict:
         """Get ship count by type."""
-        ships = self.ships.filter_by(is_destroyed=False).all()
+        return self._stats_of(self.active_ships())["ships_by_type"]
+
+    @staticmethod
+    def _stats_of(ships: List["Ship"]) -> dict:
+        """Every fleet stat (speed, range, power, composition) in a single pass over the ships."""
+        speed = fleet_range = None
+        weapons = shields = 0
+        has_tanker = can_colonize = False
         counts = {}
+
         for ship in ships:
-            ship_type = ship.design.ship_type
+            design = ship.design
+            ship_type = design.ship_type
+            if speed is None or design.effective_speed < speed:
+                speed = design.effective_speed
+            if fleet_range is None or design.effective_range < fleet_range:
+                fleet_range = design.effective_range
+            weapons += design.effective_weapons
+            shields += design.effective_shields
+            has_tanker = has_tanker or ship_type == ShipType.TANKER.value
+            can_colonize = can_colonize or ship_type == ShipType.COLONY.value
             counts[ship_type] = counts.get(ship_type, 0) + 1
-        return counts
+
+        if fleet_range is not None and has_tanker:
+            fleet_range *= TANKER_RANGE_BONUS
+
+        return {
+            "ship_count": len(ships),
+            "fleet_speed": speed or 0,
+            "fleet_range": fleet_range or 0,
+            "total_weapons": weapons,
+            "total_shields": shields,
+            "can_colonize": can_colonize,
+            "ships_by_type": counts,
+        }
 
     def to_dict(self, include_ships: bool = False):
         """Convert to dictionary."""
+        # Every stat below is derived from this one list
+        ships = self.active_ships()
+
         data = {
             "id": self.id,
             "player_id": self.player_id,
@@ -372,17 +424,11 @@ class Fleet(db.Model):
             "fuel_remaining": self.fuel_remaining,
             "max_fuel": self.max_fuel,
             "combat_behavior": self.combat_behavior,
-            "ship_count": self.ship_count,
-            "fleet_speed": self.fleet_speed,
-            "fleet_range": self.fleet_range,
-            "total_weapons": self.total_weapons,
-            "total_shields": self.total_shields,
-            "can_colonize": self.can_colonize,
-            "ships_by_type": self.get_ships_by_type(),
+            **self._stats_of(ships),
         }
 
         if include_ships:
-            data["ships"] = [ship.to_dict() for ship in self.ships.filter_by(is_destroyed=False)]
+            data["ships"] = [ship.to_dict() for ship in ships]
 
         return data
 
@@ -409,15 +455,21 @@ class Ship(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     destroyed_at = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        # Active ships of a fleet
+        db.Index("ix_ships_fleet_destroyed", "fleet_id", "is_destroyed"),
+    )
+
+    # Relationships
+    fleet = db.relationship("Fleet", back_populates="ships")
+
     def __repr__(self):
         return f"<Ship {self.id} ({self.design.ship_type if self.design else 'unknown'})>"
 
     @property
     def health_percent(self) -> float:
         """Current health as percentage."""
-        max_health = self.design.effective_shields * 10
-        current_health = max(0, max_health - self.damage)
-        return (current_health / max_health) * 100 if max_health > 0 else 0
+        return self.design.health_percent_for(self.damage)
 
     @property
     def is_damaged(self) -> bool:
@@ -489,7 +541,7 @@ class ProductionQueue(db.Model):
     completed_at = db.Column(db.DateTime, nullable=True)
 
     # Relationships
-    planet = db.relationship("Planet", backref=db.backref("production_queue", lazy="dynamic",
+    planet = db.relationship("Planet", backref=db.backref("production_queue", lazy="select",
                              order_by="ProductionQueue.priority"))
     design = db.relationship("ShipDesign")
     fleet = db.relationship("Fleet")
@@ -3,7 +3,38 @@ Galaxy and Planet models
 """
 from datetime import datetime
 from enum import Enum
+from typing import List
+
+from sqlalchemy import select
+
 from app import db
+from app.utils.loading import column_dict
+
+
+# Plain columns serialized as is by to_dict(), in output order
+GALAXY_DICT_COLUMNS = ("id", "game_id", "shape", "density", "planet_count", "width", "height")
+PLANET_DICT_COLUMNS = (
+    "id", "galaxy_id", "name", "x", "y", "is_nova", "nova_turn",
+    "temperature", "current_temperature", "gravity",
+    "metal_reserves", "metal_remaining", "state", "owner_id",
+    "population", "max_population",
+    "terraform_budget", "mining_budget", "ships_budget", "ship_production_points",
+    "is_home_planet", "history_line1", "history_line2",
+    "texture_type", "texture_index",
+)
+
+
+def habitability_of(temperature: float, gravity: float) -> float:
+    """Habitability score (0-1) of a planet at this temperature and gravity."""
+    # Temperature factor: ideal at 22C, drops off with distance
+    temp_diff = abs(temperature - 22)
+    temp_factor = max(0, 1 - (temp_diff / 100))
+
+    # Gravity factor: ideal at 1.0g
+    gravity_diff = abs(gravity - 1.0)
+    gravity_factor = max(0, 1 - (gravity_diff / 2))
+
+    return temp_factor * gravity_factor
 
 
 class GalaxyShape(str, Enum):
@@ -31,6 +62,11 @@ class PlanetState(str, Enum):
     ABANDONED = "abandoned"
 
 
+# States of a planet held by a player (plain strings: checked per planet in
+# turn, economy and AI loops)
+OWNED_PLANET_STATES = frozenset({PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value})
+
+
 class Galaxy(db.Model):
     """Galaxy model - contains all planets for a game."""
 
@@ -60,15 +96,7 @@ class Galaxy(db.Model):
 
     def to_dict(self, include_planets=False):
         """Serialize galaxy to dictionary."""
-        data = {
-            "id": self.id,
-            "game_id": self.game_id,
-            "shape": self.shape,
-            "density": self.density,
-            "planet_count": self.planet_count,
-            "width": self.width,
-            "height": self.height,
-        }
+        data = column_dict(self, GALAXY_DICT_COLUMNS)
         if include_planets:
             data["planets"] = [planet.to_dict() for planet in self.planets]
         return data
@@ -141,21 +169,20 @@ class Planet(db.Model):
     galaxy = db.relationship("Galaxy", back_populates="planets")
     owner = db.relationship("GamePlayer", back_populates="planets", foreign_keys=[owner_id])
 
+    __table_args__ = (
+        db.CheckConstraint(
+            "terraform_budget + mining_budget + ships_budget = 100",
+            name="ck_planet_budget_sum",
+        ),
+    )
+
     def __repr__(self):
         return f"<Planet {self.name} at ({self.x:.1f}, {self.y:.1f}) ({self.state})>"
 
     @property
     def habitability(self):
         """Calculate habitability score (0-1) based on temperature and gravity."""
-        # Temperature factor: ideal at 22C, drops off with distance
-        temp_diff = abs(self.current_temperature - 22)
-        temp_factor = max(0, 1 - (temp_diff / 100))
-
-        # Gravity factor: ideal at 1.0g
-        gravity_diff = abs(self.gravity - 1.0)
-        gravity_factor = max(0, 1 - (gravity_diff / 2))
-
-        return temp_factor * gravity_factor
+        return habitability_of(self.current_temperature, self.gravity)
 
     def calculate_max_population(self):
         """Calculate max population based on habitability."""
@@ -164,31 +191,21 @@ class Planet(db.Model):
 
     def to_dict(self):
         """Serialize planet to dictionary."""
-        return {
-            "id": self.id,
-            "galaxy_id": self.galaxy_id,
-            "name": self.name,
-            "x": self.x,
-            "y": self.y,
-            "is_nova": self.is_nova,
-            "nova_turn": self.nova_turn,
-            "temperature": self.temperature,
-            "current_temperature": self.current_temperature,
-            "gravity": self.gravity,
-            "metal_reserves": self.metal_reserves,
-            "metal_remaining": self.metal_remaining,
-            "state": self.state,
-            "owner_id": self.owner_id,
-            "population": self.population,
-            "max_population": self.max_population,
-            "habitability": round(self.habitability, 2),
-            "terraform_budget": self.terraform_budget,
-            "mining_budget": self.mining_budget,
-            "ships_budget": self.ships_budget,
-            "ship_production_points": self.ship_production_points,
-            "is_home_planet": self.is_home_planet,
-            "history_line1": self.history_line1,
-            "history_line2": self.history_line2,
-            "texture_type": self.texture_type,
-            "texture_index": self.texture_index,
-        }
+        data = column_dict(self, PLANET_DICT_COLUMNS)
+        data["habitability"] = round(self.habitability, 2)
+        return data
+
+    @classmethod
+    def dicts_for_galaxy(cls, galaxy_id: int) -> List[dict]:
+        """
+        Serialize all planets of a galaxy like to_dict(), straight from the
+        selected rows: read-only callers skip building one ORM object each.
+        """
+        columns = [cls.__table__.c[name] for name in PLANET_DICT_COLUMNS]
+        rows = db.session.execute(select(*columns).where(cls.galaxy_id == galaxy_id)).mappings()
+        planets = []
+        for row in rows:
+            data = dict(row)
+            data["habitability"] = round(habitability_of(row["current_temperature"], row["gravity"]), 2)
+            planets.append(data)
+        return planets
@@ -3,8 +3,11 @@ Game and GamePlayer models
 """
 from datetime import datetime
 from enum import Enum
+from typing import Optional
+
 from app import db
 from app.models.galaxy import GalaxyShape
+from app.utils.loading import column_dict
 
 
 class GameStatus(str, Enum):
@@ -25,6 +28,18 @@ class AIDifficulty(str, Enum):
     EXPERT = "expert"
 
 
+# Plain columns serialized as is by to_dict(), in output order
+GAME_DICT_COLUMNS = (
+    "id", "name", "status", "star_count", "galaxy_shape", "max_players",
+    "current_turn", "current_year", "turn_duration_years",
+    "alliances_enabled", "combat_luck_enabled",
+)
+PLAYER_DICT_COLUMNS = (
+    "id", "player_name", "color", "is_ai", "ai_difficulty", "is_active",
+    "is_ready", "is_eliminated", "planet_count", "money", "metal", "user_id",
+)
+
+
 class Game(db.Model):
     """Game instance model."""
 
@@ -67,24 +82,20 @@ class Game(db.Model):
     def __repr__(self):
         return f"<Game {self.name} ({self.status})>"
 
-    def to_dict(self):
-        """Serialize game to dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "status": self.status,
-            "star_count": self.star_count,
-            "galaxy_shape": self.galaxy_shape,
-            "max_players": self.max_players,
-            "current_turn": self.current_turn,
-            "current_year": self.current_year,
-            "turn_duration_years": self.turn_duration_years,
-            "alliances_enabled": self.alliances_enabled,
-            "combat_luck_enabled": self.combat_luck_enabled,
-            "player_count": self.players.count(),
-            "admin_id": self.admin_user_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+    def to_dict(self, player_count: Optional[int] = None):
+        """
+        Serialize game to dictionary.
+
+        Args:
+            player_count: Number of players when already known (avoids a COUNT query)
+        """
+        if player_count is None:
+            player_count = self.players.count()
+        data = column_dict(self, GAME_DICT_COLUMNS)
+        data["player_count"] = player_count
+        data["admin_id"] = self.admin_user_id
+        data["created_at"] = self.created_at.isoformat() if self.created_at else None
+        return data
 
 
 class GamePlayer(db.Model):
@@ -116,6 +127,9 @@ class GamePlayer(db.Model):
     # Turn management
     turn_submitted = db.Column(db.Boolean, default=False)
 
+    # Bumped on every fleet/design change made between turns (fleet summary cache key)
+    fleets_version = db.Column(db.Integer, default=0, nullable=False, server_default="0")
+
     # Timestamps
     joined_at = db.Column(db.DateTime, default=datetime.utcnow)
     eliminated_at = db.Column(db.DateTime, nullable=True)
@@ -132,6 +146,8 @@ class GamePlayer(db.Model):
     # Unique constraint: one user per game
     __table_args__ = (
         db.UniqueConstraint("game_id", "user_id", name="unique_user_per_game"),
+        # Per-request player lookups filter on user_id first
+        db.Index("ix_game_players_user_game", "user_id", "game_id"),
     )
 
     def __repr__(self):
@@ -139,17 +155,4 @@ class GamePlayer(db.Model):
 
     def to_dict(self):
         """Serialize player to dictionary."""
-        return {
-            "id": self.id,
-            "player_name": self.player_name,
-            "color": self.color,
-            "is_ai": self.is_ai,
-            "ai_difficulty": self.ai_difficulty,
-            "is_active": self.is_active,
-            "is_ready": self.is_ready,
-            "is_eliminated": self.is_eliminated,
-            "planet_count": self.planet_count,
-            "money": self.money,
-            "metal": self.metal,
-            "user_id": self.user_id,
-        }
+        return column_dict(self, PLAYER_DICT_COLUMNS)
@@ -35,6 +35,11 @@ class User(db.Model):
     reset_token = db.Column(db.String(255), nullable=True)
     reset_token_expires = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        # OAuth login lookup
+        db.Index("ix_users_oauth_provider_id", "oauth_provider", "oauth_id"),
+    )
+
     # Relationships
     games = db.relationship(
         "GamePlayer", back_populates="user", lazy="dynamic"
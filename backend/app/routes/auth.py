@@ -1,7 +1,9 @@
 """
 Routes d'authentification.
 """
-from flask import jsonify, request
+from datetime import datetime, timedelta
+
+from flask import current_app, jsonify, request
 from pydantic import ValidationError
 
 from app import db, limiter
@@ -17,7 +19,7 @@ from app.services.auth import (
     generate_reset_token,
     verify_reset_token,
 )
-from app.utils.errors import ValidationError as APIValidationError, AuthenticationError
+from app.utils.errors import ValidationError as APIValidationError, AuthenticationError, validation_error_response
 from app.schemas.auth import ForgotPasswordSchema, ResetPasswordSchema
 
 
@@ -78,17 +80,9 @@ def register():
         description: Trop de requêtes (rate limit)
     """
     try:
-        data = RegisterSchema(**request.get_json())
+        data = RegisterSchema.model_validate_json(request.get_data(cache=False))
     except ValidationError as e:
-        # Convert errors to JSON-serializable format
-        errors = []
-        for err in e.errors():
-            errors.append({
-                "loc": err.get("loc", []),
-                "msg": err.get("msg", ""),
-                "type": err.get("type", "")
-            })
-        return jsonify({"error": "Validation error", "details": errors}), 400
+        return validation_error_response(e, "Validation error")
 
     # Vérifier si l'email existe déjà
     existing_user = db.session.query(User).filter_by(email=data.email.lower()).first()
@@ -178,9 +172,9 @@ def login():
         description: Trop de tentatives (rate limit)
     """
     try:
-        data = LoginSchema(**request.get_json())
+        data = LoginSchema.model_validate_json(request.get_data(cache=False))
     except ValidationError as e:
-        return jsonify({"error": "Validation error", "details": e.errors()}), 400
+        return validation_error_response(e, "Validation error")
 
     try:
         user = authenticate_user(data.email, data.password)
@@ -243,9 +237,9 @@ def refresh():
         description: Trop de requêtes (rate limit)
     """
     try:
-        data = RefreshSchema(**request.get_json())
+        data = RefreshSchema.model_validate_json(request.get_data(cache=False))
     except ValidationError as e:
-        return jsonify({"error": "Validation error", "details": e.errors()}), 400
+        return validation_error_response(e, "Validation error")
 
     try:
         user = get_user_from_token(data.refresh_token, token_type="refresh")
@@ -316,13 +310,10 @@ def forgot_password():
       429:
         description: Trop de requêtes
     """
-    from flask import current_app
-    from datetime import datetime, timedelta
-
     try:
-        data = ForgotPasswordSchema(**request.get_json())
+        data = ForgotPasswordSchema.model_validate_json(request.get_data(cache=False))
     except ValidationError as e:
-        return jsonify({"error": "Validation error", "details": e.errors()}), 400
+        return validation_error_response(e, "Validation error")
 
     # Toujours retourner succès pour éviter l'énumération des emails
     user = db.session.query(User).filter_by(email=data.email.lower()).first()
@@ -386,12 +377,10 @@ def reset_password():
       429:
         description: Trop de requêtes
     """
-    from datetime import datetime
-
     try:
-        data = ResetPasswordSchema(**request.get_json())
+        data = ResetPasswordSchema.model_validate_json(request.get_data(cache=False))
     except ValidationError as e:
-        return jsonify({"error": "Validation error", "details": e.errors()}), 400
+        return validation_error_response(e, "Validation error")
 
     # Vérifier le token
     user = verify_reset_token(data.token)
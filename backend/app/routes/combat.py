@@ -3,12 +3,13 @@ Combat routes.
 Provides endpoints for combat reports and history.
 """
 from flask import jsonify, request
+from sqlalchemy import or_
 
+from app import db
 from app.routes import api_bp
-from app.models import Game, GamePlayer
 from app.models.combat import CombatReport
 from app.services.combat import CombatService
-from app.services.auth import token_required
+from app.services.auth import token_required, get_current_game, get_current_player_in_game
 
 
 # =============================================================================
@@ -17,7 +18,7 @@ from app.services.auth import token_required
 
 @api_bp.route("/games/<int:game_id>/combat-reports", methods=["GET"])
 @token_required
-def get_game_combat_reports(current_user, game_id):
+def get_game_combat_reports(game_id):
     """
     Get combat reports for a game.
 
@@ -28,15 +29,12 @@ def get_game_combat_reports(current_user, game_id):
     Returns:
         List of combat report summaries
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
     # Get player in this game
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
@@ -62,21 +60,18 @@ def get_game_combat_reports(current_user, game_id):
 
 @api_bp.route("/games/<int:game_id>/combat-reports/turn/<int:turn>", methods=["GET"])
 @token_required
-def get_turn_combat_reports(current_user, game_id, turn):
+def get_turn_combat_reports(game_id, turn):
     """
     Get all combat reports for a specific turn.
 
     Returns:
         List of detailed combat reports
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
@@ -92,22 +87,19 @@ def get_turn_combat_reports(current_user, game_id, turn):
 
 @api_bp.route("/combat-reports/<int:report_id>", methods=["GET"])
 @token_required
-def get_combat_report(current_user, report_id):
+def get_combat_report(report_id):
     """
     Get detailed combat report by ID.
 
     Returns:
         Full combat report with combat log
     """
-    report = CombatReport.query.get(report_id)
+    report = db.session.get(CombatReport, report_id)
     if not report:
         return jsonify({"error": "Combat report not found"}), 404
 
     # Check access (player must be in the game)
-    player = GamePlayer.query.filter_by(
-        game_id=report.game_id,
-        user_id=current_user.id
-    ).first()
+    player = get_current_player_in_game(report.game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
@@ -117,7 +109,7 @@ def get_combat_report(current_user, report_id):
 
 @api_bp.route("/games/<int:game_id>/my-battles", methods=["GET"])
 @token_required
-def get_my_battles(current_user, game_id):
+def get_my_battles(game_id):
     """
     Get combat history for current player.
 
@@ -127,14 +119,11 @@ def get_my_battles(current_user, game_id):
     Returns:
         List of battles involving this player
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
@@ -165,27 +154,23 @@ def get_my_battles(current_user, game_id):
 
 @api_bp.route("/games/<int:game_id>/combat-stats", methods=["GET"])
 @token_required
-def get_combat_stats(current_user, game_id):
+def get_combat_stats(game_id):
     """
     Get combat statistics for current player.
 
     Returns:
         Combat statistics (wins, losses, ships destroyed, etc.)
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
 
     # Get all battles involving player
-    from sqlalchemy import or_
     reports = CombatReport.query.filter(
         CombatReport.game_id == game_id,
         or_(
@@ -2,13 +2,23 @@
 Economy and turn management routes
 """
 from flask import request, jsonify, g
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError, model_validator
+from sqlalchemy import and_
+from sqlalchemy.orm import contains_eager, selectinload
 from typing import Optional
 
+from app import db
 from app.routes import api_bp
-from app.services.auth import token_required
+from app.services.auth import token_required, get_current_game, get_current_player_in_game
 from app.services import EconomyService, TurnService
 from app.models import Game, GamePlayer, Planet, GameStatus, ProductionQueue
+from app.utils.json_stream import stream_json
+from app.utils.errors import validation_error_response
+from app.utils.http import etagged
+from app.utils.loading import loader_options
+
+# Hoisted out of the handlers (avoids the Enum attribute lookup per request)
+_RUNNING = GameStatus.RUNNING.value
 
 
 # Pydantic schemas
@@ -28,6 +38,43 @@ class PlanetBudgetSchema(BaseModel):
     mining_budget: int = Field(ge=0, le=100)
     ships_budget: int = Field(ge=0, le=100)
 
+    @model_validator(mode="after")
+    def check_total(self):
+        total = self.terraform_budget + self.mining_budget + self.ships_budget
+        if total != 100:
+            raise ValueError(
+                f"terraform_budget + mining_budget + ships_budget must equal 100 (got {total})"
+            )
+        return self
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+def get_owned_planet(planet_id: int) -> tuple:
+    """Get planet and its owner (with game) if owned by current user, in one query."""
+    row = db.session.query(Planet, GamePlayer).outerjoin(
+        GamePlayer, and_(
+            GamePlayer.id == Planet.owner_id,
+            GamePlayer.user_id == g.current_user.id,
+        )
+    ).outerjoin(
+        Game, GamePlayer.game_id == Game.id
+    ).filter(
+        Planet.id == planet_id
+    ).options(
+        contains_eager(GamePlayer.game)
+    ).one_or_none()
+
+    if row is None:
+        return None, None, ({"error": "Planet not found"}, 404)
+
+    if row.GamePlayer is None:
+        return row.Planet, None, ({"error": "This planet does not belong to you"}, 403)
+
+    return row.Planet, row.GamePlayer, None
+
 
 # =============================================================================
 # Economy Endpoints
@@ -56,14 +103,11 @@ def get_economy(game_id: int):
       404:
         description: Partie non trouvée
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
@@ -108,21 +152,18 @@ def borrow_money(game_id: int):
         description: Non membre de la partie
     """
     try:
-        data = BorrowSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = BorrowSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    if game.status != GameStatus.RUNNING.value:
+    if game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
@@ -130,7 +171,6 @@ def borrow_money(game_id: int):
     if player.is_eliminated:
         return jsonify({"error": "You have been eliminated"}), 400
 
-    from app import db
     success, message = EconomyService.borrow(player, data.amount)
     if success:
         db.session.commit()
@@ -178,26 +218,22 @@ def repay_debt(game_id: int):
         description: Remboursement impossible
     """
     try:
-        data = RepaySchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = RepaySchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    if game.status != GameStatus.RUNNING.value:
+    if game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
 
-    from app import db
     success, message = EconomyService.repay_debt(player, data.amount)
     if success:
         db.session.commit()
@@ -257,29 +293,14 @@ def update_planet_budget(planet_id: int):
         description: Planète ne vous appartient pas
     """
     try:
-        data = PlanetBudgetSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = PlanetBudgetSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
-    # Validate that budgets sum to 100
-    total = data.terraform_budget + data.mining_budget + data.ships_budget
-    if total != 100:
-        return jsonify({"error": f"terraform_budget + mining_budget + ships_budget must equal 100 (got {total})"}), 400
-
-    planet = Planet.query.get(planet_id)
-    if not planet:
-        return jsonify({"error": "Planet not found"}), 404
-
-    # Check ownership
-    player = GamePlayer.query.filter_by(
-        id=planet.owner_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "This planet does not belong to you"}), 403
+    planet, player, error = get_owned_planet(planet_id)
+    if error:
+        return jsonify(error[0]), error[1]
 
-    from app import db
     planet.terraform_budget = data.terraform_budget
     planet.mining_budget = data.mining_budget
     planet.ships_budget = data.ships_budget
@@ -333,28 +354,21 @@ def abandon_planet(planet_id: int):
       404:
         description: Planète non trouvée
     """
-    data = AbandonPlanetSchema(**(request.json or {}))
-
-    planet = Planet.query.get(planet_id)
-    if not planet:
-        return jsonify({"error": "Planet not found"}), 404
-
-    # Check ownership
-    player = GamePlayer.query.filter_by(
-        id=planet.owner_id,
-        user_id=g.current_user.id
-    ).first()
+    try:
+        # The body is optional: no body means the default options
+        data = AbandonPlanetSchema.model_validate_json(request.get_data(cache=False) or b"{}")
+    except ValidationError as e:
+        return validation_error_response(e)
 
-    if not player:
-        return jsonify({"error": "This planet does not belong to you"}), 403
+    planet, player, error = get_owned_planet(planet_id)
+    if error:
+        return jsonify(error[0]), error[1]
 
     # Check game is running
-    game = Game.query.get(player.game_id)
-    if game.status != GameStatus.RUNNING.value:
+    if player.game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
     try:
-        from app import db
         result = EconomyService.abandon_planet(planet, strip_mine=data.strip_mine)
         db.session.commit()
 
@@ -421,17 +435,14 @@ def submit_turn(game_id: int):
       400:
         description: Erreur
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    if game.status != GameStatus.RUNNING.value:
+    if game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
@@ -447,7 +458,8 @@ def submit_turn(game_id: int):
             "all_players_submitted": all_submitted,
         }
 
-        # If all players submitted, process the turn
+        # If all players submitted, process the turn (it commits the
+        # submission along with the turn results)
         if all_submitted:
             turn_results = TurnService.process_turn(game)
             response["turn_processed"] = True
@@ -458,6 +470,10 @@ def submit_turn(game_id: int):
             if victory:
                 response["victory"] = victory
 
+            # Turn results can be large: stream them section by section
+            return stream_json(response, depth=3)
+
+        db.session.commit()
         return jsonify(response)
 
     except ValueError as e:
@@ -485,7 +501,7 @@ def force_process_turn(game_id: int):
       403:
         description: Non autorisé
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
@@ -493,7 +509,7 @@ def force_process_turn(game_id: int):
     if game.admin_user_id != g.current_user.id:
         return jsonify({"error": "Only game admin can force turn processing"}), 403
 
-    if game.status != GameStatus.RUNNING.value:
+    if game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
     try:
@@ -509,7 +525,8 @@ def force_process_turn(game_id: int):
         if victory:
             response["victory"] = victory
 
-        return jsonify(response)
+        # Turn results can be large: stream them section by section
+        return stream_json(response, depth=3)
 
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
@@ -528,6 +545,7 @@ class AddToQueueSchema(BaseModel):
 
 @api_bp.route("/planets/<int:planet_id>/production", methods=["GET"])
 @token_required
+@etagged
 def get_production_queue(planet_id: int):
     """
     Obtenir la file de production d'une planète
@@ -549,23 +567,17 @@ def get_production_queue(planet_id: int):
       404:
         description: Planète non trouvée
     """
-    planet = Planet.query.get(planet_id)
-    if not planet:
-        return jsonify({"error": "Planet not found"}), 404
-
-    # Check ownership
-    player = GamePlayer.query.filter_by(
-        id=planet.owner_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "This planet does not belong to you"}), 403
-
-    # Get queue items
-    queue_items = planet.production_queue.filter_by(is_completed=False).order_by(
-        ProductionQueue.priority
-    ).all()
+    planet, player, error = get_owned_planet(planet_id)
+    if error:
+        return jsonify(error[0]), error[1]
+
+    # Get queue items, with their designs in one extra query (to_dict reads them)
+    queue_items = ProductionQueue.query.filter_by(
+        planet_id=planet.id,
+        is_completed=False,
+    ).options(
+        *loader_options(selectinload(ProductionQueue.design))
+    ).order_by(ProductionQueue.priority).all()
 
     # Calculate production stats
     production_output = EconomyService.calculate_ship_production_output(planet)
@@ -626,29 +638,18 @@ def add_to_production_queue(planet_id: int):
         description: Planète non trouvée
     """
     try:
-        data = AddToQueueSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = AddToQueueSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
-    planet = Planet.query.get(planet_id)
-    if not planet:
-        return jsonify({"error": "Planet not found"}), 404
-
-    # Check ownership
-    player = GamePlayer.query.filter_by(
-        id=planet.owner_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "This planet does not belong to you"}), 403
+    planet, player, error = get_owned_planet(planet_id)
+    if error:
+        return jsonify(error[0]), error[1]
 
     # Check game is running
-    game = Game.query.get(player.game_id)
-    if game.status != GameStatus.RUNNING.value:
+    if player.game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
-    from app import db
     success, message, items = EconomyService.add_to_production_queue(
         planet=planet,
         design_id=data.design_id,
@@ -692,21 +693,22 @@ def remove_from_production_queue(queue_id: int):
       404:
         description: Élément non trouvé
     """
-    item = ProductionQueue.query.get(queue_id)
-    if not item:
+    # Item and ownership in one query: player is None when the planet is not ours
+    row = db.session.query(ProductionQueue, GamePlayer).join(
+        Planet, Planet.id == ProductionQueue.planet_id
+    ).outerjoin(
+        GamePlayer,
+        (GamePlayer.id == Planet.owner_id) & (GamePlayer.user_id == g.current_user.id),
+    ).filter(ProductionQueue.id == queue_id).first()
+
+    if not row:
         return jsonify({"error": "Queue item not found"}), 404
 
-    # Check ownership
-    planet = item.planet
-    player = GamePlayer.query.filter_by(
-        id=planet.owner_id,
-        user_id=g.current_user.id
-    ).first()
-
+    # The item stays in the identity map for EconomyService below
+    _, player = row
     if not player:
         return jsonify({"error": "This production queue does not belong to you"}), 403
 
-    from app import db
     success, message = EconomyService.remove_from_production_queue(queue_id)
 
     if success:
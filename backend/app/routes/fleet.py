@@ -1,18 +1,43 @@
 """
 Fleet management routes
 """
-from flask import request, jsonify, g
-from pydantic import BaseModel, Field
+from functools import wraps
+
+import orjson
+from flask import current_app, request, jsonify, g
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy import and_
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
 from typing import List, Optional
 
 from app import db
 from app.routes import api_bp
-from app.services.auth import token_required
+from app.services.auth import token_required, get_current_player, get_current_player_in_game
 from app.services import FleetService
+from app.utils.cache import cache_delete, cache_get, cache_set
+from app.utils.errors import validation_error_response
+from app.utils.http import etagged, not_modified, revision_etag, tag_response
+from app.utils.loading import loader_options
 from app.models import (
     Game, GamePlayer, Planet, GameStatus,
     Ship, ShipDesign, Fleet, ShipType, FleetStatus,
 )
+from app.models.galaxy import Galaxy
+
+# Hoisted out of the handlers (avoids the Enum attribute lookup per request)
+_RUNNING = GameStatus.RUNNING.value
+
+# Seconds a design's costs stay cached (dropped early when its prototype is built)
+DESIGN_COSTS_CACHE_TTL = 300
+
+# Seconds a fleet summary stays cached (its key changes with every fleet change)
+FLEET_SUMMARY_CACHE_TTL = 300
+
+# Seconds stationed ship counts stay cached (same versioned key scheme)
+STATIONED_SHIPS_CACHE_TTL = 300
+
+# Eager load for routes working on a fleet's ships
+_FLEET_SHIPS = selectinload(Fleet.ships).joinedload(Ship.design)
 
 
 # =============================================================================
@@ -71,19 +96,110 @@ class SendShipsFromPlanetSchema(BaseModel):
 
 def get_player_in_game(game_id: int) -> tuple:
     """Get game and player for current user."""
-    game = Game.query.get(game_id)
+    player = get_current_player_in_game(game_id)
+    if player:
+        return player.game, player, None
+
+    game = db.session.get(Game, game_id)
     if not game:
         return None, None, ({"error": "Game not found"}, 404)
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    return game, None, ({"error": "You are not in this game"}, 403)
 
-    if not player:
-        return game, None, ({"error": "You are not in this game"}, 403)
 
-    return game, player, None
+def _owned_fleets_query(*fleet_ids, for_update: bool = False):
+    """
+    Fleets of the current user with their player and game, in one query.
+
+    With for_update, the player rows are locked (SELECT ... FOR UPDATE OF)
+    until commit, for routes that change the player's resources.
+    """
+    query = db.session.query(Fleet, GamePlayer).join(
+        GamePlayer, Fleet.player_id == GamePlayer.id
+    ).join(
+        Game, GamePlayer.game_id == Game.id
+    ).filter(
+        Fleet.id.in_(fleet_ids),
+        GamePlayer.user_id == g.current_user.id,
+    ).options(
+        contains_eager(GamePlayer.game),
+        *loader_options(_FLEET_SHIPS),
+    )
+    if for_update:
+        query = query.with_for_update(of=GamePlayer).populate_existing()
+    return query
+
+
+def resolve_fleet_context(fleet_id: int, for_update: bool = False) -> tuple:
+    """Get fleet (with its ships) and owning player for current user."""
+    row = _owned_fleets_query(fleet_id, for_update=for_update).one_or_none()
+    if row:
+        return row.Fleet, row.GamePlayer, None
+
+    if db.session.get(Fleet, fleet_id) is None:
+        return None, None, ({"error": "Fleet not found"}, 404)
+
+    return None, None, ({"error": "This fleet does not belong to you"}, 403)
+
+
+def fleet_owned(f=None, *, for_update: bool = False):
+    """
+    Load the fleet of the route's fleet_id and pass it with its owner.
+
+    The view receives (fleet, player) instead of fleet_id; 404/403 are
+    answered here. Must be applied after token_required. Use
+    @fleet_owned(for_update=True) when the view spends or credits the
+    player's resources.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(fleet_id: int, *args, **kwargs):
+            fleet, player, error = resolve_fleet_context(fleet_id, for_update=for_update)
+            if error:
+                return jsonify(error[0]), error[1]
+            return f(fleet, player, *args, **kwargs)
+
+        return decorated
+
+    return decorator(f) if f else decorator
+
+
+def lock_player(player: GamePlayer):
+    """
+    Re-read the player's resources with SELECT ... FOR UPDATE.
+
+    Money and metal are read, checked and written back by the request:
+    the row lock (held until commit) keeps two concurrent requests from
+    spending the same resources, or from moving the same ships.
+    """
+    db.session.refresh(player, ["money", "metal"], with_for_update=True)
+
+
+def resolve_planet_context(planet_id: int) -> tuple:
+    """Get planet (with its galaxy) and player of the current user in its game."""
+    row = db.session.query(Planet, GamePlayer).join(
+        Galaxy, Planet.galaxy_id == Galaxy.id
+    ).outerjoin(
+        GamePlayer, and_(
+            GamePlayer.game_id == Galaxy.game_id,
+            GamePlayer.user_id == g.current_user.id,
+        )
+    ).outerjoin(
+        Game, GamePlayer.game_id == Game.id
+    ).filter(
+        Planet.id == planet_id
+    ).options(
+        contains_eager(Planet.galaxy),
+        contains_eager(GamePlayer.game),
+    ).one_or_none()
+
+    if row is None:
+        return None, None, ({"error": "Planet not found"}, 404)
+
+    if row.GamePlayer is None:
+        return row.Planet, None, ({"error": "You are not in this game"}, 403)
+
+    return row.Planet, row.GamePlayer, None
 
 
 # =============================================================================
@@ -92,6 +208,7 @@ def get_player_in_game(game_id: int) -> tuple:
 
 @api_bp.route("/games/<int:game_id>/designs", methods=["GET"])
 @token_required
+@etagged
 def get_designs(game_id: int):
     """
     Liste des designs du joueur
@@ -170,15 +287,15 @@ def create_design(game_id: int):
         description: Données invalides
     """
     try:
-        data = CreateDesignSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = CreateDesignSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
     game, player, error = get_player_in_game(game_id)
     if error:
         return jsonify(error[0]), error[1]
 
-    if game.status != GameStatus.RUNNING.value:
+    if game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
     # Validate ship type
@@ -198,6 +315,7 @@ def create_design(game_id: int):
         mini_level=data.mini_level,
     )
 
+    FleetService.bump_fleets_version(player)
     db.session.commit()
 
     return jsonify(design.to_dict()), 201
@@ -205,6 +323,7 @@ def create_design(game_id: int):
 
 @api_bp.route("/games/<int:game_id>/designs/<int:design_id>/costs", methods=["GET"])
 @token_required
+@etagged
 def get_design_costs(game_id: int, design_id: int):
     """
     Obtenir les coûts d'un design
@@ -216,11 +335,17 @@ def get_design_costs(game_id: int, design_id: int):
     if error:
         return jsonify(error[0]), error[1]
 
-    design = ShipDesign.query.get(design_id)
+    # Costs only change when the prototype is built: serve them from the cache
+    cache_key = FleetService.design_costs_cache_key(player, design_id)
+    cached = cache_get(cache_key)
+    if cached:
+        return current_app.response_class(cached, mimetype="application/json")
+
+    design = db.session.get(ShipDesign, design_id)
     if not design or design.player_id != player.id:
         return jsonify({"error": "Design not found"}), 404
 
-    return jsonify({
+    costs = {
         "design_id": design.id,
         "name": design.name,
         "prototype_cost_money": design.prototype_cost_money,
@@ -228,7 +353,10 @@ def get_design_costs(game_id: int, design_id: int):
         "production_cost_money": design.production_cost_money,
         "production_cost_metal": design.production_cost_metal,
         "is_prototype_built": design.is_prototype_built,
-    })
+    }
+    cache_set(cache_key, orjson.dumps(costs), DESIGN_COSTS_CACHE_TTL)
+
+    return jsonify(costs)
 
 
 @api_bp.route("/games/<int:game_id>/designs/<int:design_id>/build", methods=["POST"])
@@ -270,32 +398,44 @@ def build_ships(game_id: int, design_id: int):
         description: Construction impossible
     """
     try:
-        data = BuildShipsSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = BuildShipsSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
     game, player, error = get_player_in_game(game_id)
     if error:
         return jsonify(error[0]), error[1]
 
-    if game.status != GameStatus.RUNNING.value:
+    if game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
-    design = ShipDesign.query.get(design_id)
+    design = db.session.get(ShipDesign, design_id)
     if not design or design.player_id != player.id:
         return jsonify({"error": "Design not found"}), 404
 
-    fleet = Fleet.query.get(data.fleet_id)
+    fleet = db.session.get(Fleet, data.fleet_id)
     if not fleet or fleet.player_id != player.id:
         return jsonify({"error": "Fleet not found"}), 404
 
+    lock_player(player)
+    # Fleet and design were read before the lock: re-read what the build checks
+    db.session.refresh(fleet, ["status"], with_for_update=True)
+    db.session.refresh(design, ["is_prototype_built", "ships_built"], with_for_update=True)
+
     if fleet.status != FleetStatus.STATIONED.value:
         return jsonify({"error": "Fleet must be stationed to build ships"}), 400
 
+    prototype_pending = not design.is_prototype_built
     success, message, ships = FleetService.build_ships(player, design, fleet, data.count)
 
     if success:
+        FleetService.bump_fleets_version(player)
+        # Key built before the commit, which expires the loaded player and game
+        costs_key = FleetService.design_costs_cache_key(player, design.id)
         db.session.commit()
+        # Dropped once committed, so a concurrent read cannot cache the old costs again
+        if prototype_pending:
+            cache_delete(costs_key)
         return jsonify({
             "success": True,
             "message": message,
@@ -313,6 +453,7 @@ def build_ships(game_id: int, design_id: int):
 
 @api_bp.route("/games/<int:game_id>/fleets", methods=["GET"])
 @token_required
+@etagged
 def get_fleets(game_id: int):
     """
     Liste des flottes du joueur
@@ -329,8 +470,19 @@ def get_fleets(game_id: int):
     if error:
         return jsonify(error[0]), error[1]
 
-    summary = FleetService.get_player_fleet_summary(player)
-    return jsonify(summary)
+    # Cached until the player's fleets change (new version) or the turn ends
+    cache_key = FleetService.fleet_summary_cache_key(player)
+    cached = cache_get(cache_key)
+    if cached:
+        return current_app.response_class(cached, mimetype="application/json")
+
+    fleets = Fleet.query.filter_by(player_id=player.id).options(
+        *loader_options(_FLEET_SHIPS)
+    ).all()
+    summary = FleetService.get_player_fleet_summary(player, fleets=fleets)
+    response = jsonify(summary)
+    cache_set(cache_key, response.get_data(), FLEET_SUMMARY_CACHE_TTL)
+    return response
 
 
 @api_bp.route("/games/<int:game_id>/fleets", methods=["POST"])
@@ -361,20 +513,20 @@ def create_fleet(game_id: int):
         description: Flotte créée
     """
     try:
-        data = CreateFleetSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = CreateFleetSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
     game, player, error = get_player_in_game(game_id)
     if error:
         return jsonify(error[0]), error[1]
 
-    if game.status != GameStatus.RUNNING.value:
+    if game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
     planet = None
     if data.planet_id:
-        planet = Planet.query.get(data.planet_id)
+        planet = db.session.get(Planet, data.planet_id)
         if not planet:
             return jsonify({"error": "Planet not found"}), 404
         # Must own the planet to create fleet there
@@ -382,6 +534,7 @@ def create_fleet(game_id: int):
             return jsonify({"error": "You don't own this planet"}), 403
 
     fleet = FleetService.create_fleet(player, data.name, planet)
+    FleetService.bump_fleets_version(player)
     db.session.commit()
 
     return jsonify(fleet.to_dict()), 201
@@ -389,32 +542,22 @@ def create_fleet(game_id: int):
 
 @api_bp.route("/fleets/<int:fleet_id>", methods=["GET"])
 @token_required
-def get_fleet(fleet_id: int):
+@fleet_owned
+@etagged
+def get_fleet(fleet: Fleet, player: GamePlayer):
     """
     Détails d'une flotte
     ---
     tags:
       - Flottes
     """
-    fleet = Fleet.query.get(fleet_id)
-    if not fleet:
-        return jsonify({"error": "Fleet not found"}), 404
-
-    # Check ownership
-    player = GamePlayer.query.filter_by(
-        id=fleet.player_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "This fleet does not belong to you"}), 403
-
     return jsonify(fleet.to_dict(include_ships=True))
 
 
 @api_bp.route("/fleets/<int:fleet_id>/move", methods=["POST"])
 @token_required
-def move_fleet(fleet_id: int):
+@fleet_owned
+def move_fleet(fleet: Fleet, player: GamePlayer):
     """
     Déplacer une flotte vers une planète
     ---
@@ -444,33 +587,21 @@ def move_fleet(fleet_id: int):
         description: Déplacement impossible
     """
     try:
-        data = MoveFleetSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
-
-    fleet = Fleet.query.get(fleet_id)
-    if not fleet:
-        return jsonify({"error": "Fleet not found"}), 404
-
-    player = GamePlayer.query.filter_by(
-        id=fleet.player_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "This fleet does not belong to you"}), 403
+        data = MoveFleetSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
-    game = Game.query.get(player.game_id)
-    if game.status != GameStatus.RUNNING.value:
+    if player.game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
-    destination = Planet.query.get(data.destination_planet_id)
+    destination = db.session.get(Planet, data.destination_planet_id)
     if not destination:
         return jsonify({"error": "Destination planet not found"}), 404
 
-    success, message = FleetService.move_fleet(fleet, destination, game.current_turn)
+    success, message = FleetService.move_fleet(fleet, destination, player.game.current_turn)
 
     if success:
+        FleetService.bump_fleets_version(player)
         db.session.commit()
         return jsonify({
             "success": True,
@@ -483,7 +614,8 @@ def move_fleet(fleet_id: int):
 
 @api_bp.route("/fleets/<int:fleet_id>/split", methods=["POST"])
 @token_required
-def split_fleet(fleet_id: int):
+@fleet_owned
+def split_fleet(fleet: Fleet, player: GamePlayer):
     """
     Diviser une flotte en deux
     ---
@@ -491,25 +623,14 @@ def split_fleet(fleet_id: int):
       - Flottes
     """
     try:
-        data = SplitFleetSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
-
-    fleet = Fleet.query.get(fleet_id)
-    if not fleet:
-        return jsonify({"error": "Fleet not found"}), 404
-
-    player = GamePlayer.query.filter_by(
-        id=fleet.player_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "This fleet does not belong to you"}), 403
+        data = SplitFleetSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
     success, message, new_fleet = FleetService.split_fleet(fleet, data.ship_ids, data.new_fleet_name)
 
     if success:
+        FleetService.bump_fleets_version(player)
         db.session.commit()
         return jsonify({
             "success": True,
@@ -531,27 +652,34 @@ def merge_fleet(fleet_id: int):
       - Flottes
     """
     try:
-        data = MergeFleetSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
-
-    fleet1 = Fleet.query.get(fleet_id)
-    fleet2 = Fleet.query.get(data.fleet_id_to_merge)
-
-    if not fleet1 or not fleet2:
-        return jsonify({"error": "Fleet not found"}), 404
+        data = MergeFleetSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
+
+    # Load both fleets with their owners in a single query
+    rows = {
+        row.Fleet.id: row
+        for row in _owned_fleets_query(fleet_id, data.fleet_id_to_merge)
+    }
+    row1 = rows.get(fleet_id)
+    row2 = rows.get(data.fleet_id_to_merge)
+
+    if not row1 or not row2:
+        found = Fleet.query.filter(Fleet.id.in_([fleet_id, data.fleet_id_to_merge])).count()
+        if found < len({fleet_id, data.fleet_id_to_merge}):
+            return jsonify({"error": "Fleet not found"}), 404
+        return jsonify({"error": "Fleets must belong to you"}), 403
 
-    player = GamePlayer.query.filter_by(
-        id=fleet1.player_id,
-        user_id=g.current_user.id
-    ).first()
+    fleet1, player = row1.Fleet, row1.GamePlayer
+    fleet2 = row2.Fleet
 
-    if not player or fleet2.player_id != player.id:
+    if fleet2.player_id != player.id:
         return jsonify({"error": "Fleets must belong to you"}), 403
 
     success, message = FleetService.merge_fleets(fleet1, fleet2)
 
     if success:
+        FleetService.bump_fleets_version(player)
         db.session.commit()
         return jsonify({
             "success": True,
@@ -564,28 +692,18 @@ def merge_fleet(fleet_id: int):
 
 @api_bp.route("/fleets/<int:fleet_id>/disband", methods=["POST"])
 @token_required
-def disband_fleet(fleet_id: int):
+@fleet_owned(for_update=True)
+def disband_fleet(fleet: Fleet, player: GamePlayer):
     """
     Démanteler une flotte entière (récupère 75% du métal)
     ---
     tags:
       - Flottes
     """
-    fleet = Fleet.query.get(fleet_id)
-    if not fleet:
-        return jsonify({"error": "Fleet not found"}), 404
-
-    player = GamePlayer.query.filter_by(
-        id=fleet.player_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "This fleet does not belong to you"}), 403
-
     success, message, metal_recovered = FleetService.disband_fleet(fleet)
 
     if success:
+        FleetService.bump_fleets_version(player)
         db.session.commit()
         return jsonify({
             "success": True,
@@ -606,24 +724,29 @@ def disband_ship(ship_id: int):
     tags:
       - Vaisseaux
     """
-    ship = Ship.query.get(ship_id)
+    ship = db.session.get(
+        Ship, ship_id, options=loader_options(joinedload(Ship.fleet), joinedload(Ship.design))
+    )
     if not ship:
         return jsonify({"error": "Ship not found"}), 404
 
     if not ship.fleet:
         return jsonify({"error": "Ship must be in a fleet"}), 400
 
-    player = GamePlayer.query.filter_by(
-        id=ship.fleet.player_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player(ship.fleet.player_id)
 
     if not player:
         return jsonify({"error": "This ship does not belong to you"}), 403
 
+    lock_player(player)
+    # Ship and fleet were read before the lock: re-read them under it, so a
+    # concurrent disband of the same ship finds it already destroyed
+    db.session.refresh(ship, ["is_destroyed"], with_for_update=True)
+    db.session.refresh(ship.fleet, ["status", "current_planet_id"], with_for_update=True)
     success, message, metal_recovered = FleetService.disband_ship(ship)
 
     if success:
+        FleetService.bump_fleets_version(player)
         db.session.commit()
         return jsonify({
             "success": True,
@@ -679,38 +802,31 @@ def send_ships_from_planet(planet_id: int):
         description: Envoi impossible
     """
     try:
-        data = SendShipsFromPlanetSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
-
-    # Get origin planet
-    origin_planet = Planet.query.get(planet_id)
-    if not origin_planet:
-        return jsonify({"error": "Origin planet not found"}), 404
+        data = SendShipsFromPlanetSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
-    # Get player
-    player = GamePlayer.query.filter_by(
-        game_id=origin_planet.game_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "You are not in this game"}), 403
+    # Origin planet, player and game in one query
+    origin_planet, player, error = resolve_planet_context(planet_id)
+    if error:
+        return jsonify(error[0]), error[1]
 
     # Check game is running
-    game = Game.query.get(origin_planet.game_id)
-    if game.status != GameStatus.RUNNING.value:
+    game = player.game
+    if game.status != _RUNNING:
         return jsonify({"error": "Game is not running"}), 400
 
     # Get destination planet
-    destination_planet = Planet.query.get(data.destination_planet_id)
+    destination_planet = db.session.get(Planet, data.destination_planet_id)
     if not destination_planet:
         return jsonify({"error": "Destination planet not found"}), 404
 
-    if destination_planet.game_id != origin_planet.game_id:
+    # One galaxy per game
+    if destination_planet.galaxy_id != origin_planet.galaxy_id:
         return jsonify({"error": "Planets must be in the same game"}), 400
 
     # Send ships
+    lock_player(player)
     success, message, new_fleet = FleetService.send_ships_from_planet(
         player=player,
         origin_planet=origin_planet,
@@ -721,6 +837,7 @@ def send_ships_from_planet(planet_id: int):
     )
 
     if success:
+        FleetService.bump_fleets_version(player)
         db.session.commit()
         return jsonify({
             "success": True,
@@ -751,28 +868,34 @@ def get_stationed_ships(planet_id: int):
       200:
         description: Vaisseaux disponibles
     """
-    planet = Planet.query.get(planet_id)
-    if not planet:
-        return jsonify({"error": "Planet not found"}), 404
-
-    player = GamePlayer.query.filter_by(
-        game_id=planet.game_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "You are not in this game"}), 403
+    planet, player, error = resolve_planet_context(planet_id)
+    if error:
+        return jsonify(error[0]), error[1]
 
     if planet.owner_id != player.id:
         return jsonify({"error": "You don't own this planet"}), 403
 
+    # Cached until the player's fleets change (new version) or the turn ends;
+    # the same revision tells the client whether its copy is still current
+    cache_key = FleetService.stationed_ships_cache_key(player, planet_id)
+    etag = revision_etag(cache_key)
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+
+    cached = cache_get(cache_key)
+    if cached:
+        return tag_response(current_app.response_class(cached, mimetype="application/json"), etag)
+
     ships_by_type = FleetService.get_stationed_ships_at_planet(player, planet)
 
-    return jsonify({
+    response = jsonify({
         "planet_id": planet_id,
         "ships_by_type": ships_by_type,
         "total_ships": sum(ships_by_type.values()),
     })
+    cache_set(cache_key, response.get_data(), STATIONED_SHIPS_CACHE_TTL)
+    return tag_response(response, etag)
 
 
 @api_bp.route("/planets/<int:planet_id>/ships-detailed", methods=["GET"])
@@ -794,59 +917,67 @@ def get_stationed_ships_detailed(planet_id: int):
       200:
         description: Liste des vaisseaux avec détails
     """
-    planet = Planet.query.get(planet_id)
-    if not planet:
-        return jsonify({"error": "Planet not found"}), 404
-
-    # Get game from galaxy
-    from app.models.galaxy import Galaxy
-    galaxy = Galaxy.query.get(planet.galaxy_id)
-    if not galaxy:
-        return jsonify({"error": "Galaxy not found"}), 404
-
-    player = GamePlayer.query.filter_by(
-        game_id=galaxy.game_id,
-        user_id=g.current_user.id
-    ).first()
-
-    if not player:
-        return jsonify({"error": "You are not in this game"}), 403
+    planet, player, error = resolve_planet_context(planet_id)
+    if error:
+        return jsonify(error[0]), error[1]
 
     if planet.owner_id != player.id:
         return jsonify({"error": "You don't own this planet"}), 403
 
-    # Récupérer toutes les flottes stationnées du joueur
-    from app.models.fleet import Fleet, Ship, FleetStatus
-    fleets = Fleet.query.filter_by(
-        player_id=player.id,
-        current_planet_id=planet_id,
-        status=FleetStatus.STATIONED.value
-    ).all()
+    # Même révision que les vaisseaux agrégés : dommages et réparations
+    # n'évoluent qu'au changement de tour
+    etag = revision_etag("detailed", FleetService.stationed_ships_cache_key(player, planet_id))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+
+    # Vaisseaux actifs des flottes stationnées du joueur en une seule requête,
+    # en ne lisant que les colonnes utiles (seuls les designs, peu nombreux,
+    # sont chargés comme objets)
+    rows = db.session.query(
+        Ship.id, Ship.damage,
+        Fleet.id, Fleet.name, Fleet.fuel_remaining, Fleet.max_fuel,
+        ShipDesign,
+    ).select_from(Ship).join(
+        Fleet, Ship.fleet_id == Fleet.id
+    ).join(
+        ShipDesign, Ship.design_id == ShipDesign.id
+    ).filter(
+        Fleet.player_id == player.id,
+        Fleet.current_planet_id == planet_id,
+        Fleet.status == FleetStatus.STATIONED.value,
+        Ship.is_destroyed == False,
+    ).options(*loader_options()).order_by(Fleet.id, Ship.id).all()
+
+    # Les valeurs issues du design (dont le scrap, 75% du coût métal) sont
+    # calculées une fois par design, pas une fois par vaisseau
+    design_fields = {}
 
     ships_list = []
-    for fleet in fleets:
-        for ship in fleet.ships.filter_by(is_destroyed=False):
-            design = ship.design
-            # Calcul du scrap (75% du coût métal)
-            scrap_value = int(design.production_cost_metal * 0.75) if design else 0
-
-            ships_list.append({
-                "id": ship.id,
-                "fleet_id": fleet.id,
-                "fleet_name": fleet.name,
-                "design_name": design.name if design else "?",
-                "ship_type": design.ship_type if design else "?",
-                "weapons": design.effective_weapons if design else 0,
-                "shields": design.effective_shields if design else 0,
-                "speed": design.effective_speed if design else 0,
-                "range": design.effective_range if design else 0,
-                "fuel": fleet.fuel_remaining,
-                "max_fuel": fleet.max_fuel,
-                "health_percent": ship.health_percent,
-                "scrap_value": scrap_value,
-            })
+    for ship_id, damage, fleet_id, fleet_name, fuel, max_fuel, design in rows:
+        fields = design_fields.get(design.id)
+        if fields is None:
+            fields = design_fields[design.id] = {
+                "design_name": design.name,
+                "ship_type": design.ship_type,
+                "weapons": design.effective_weapons,
+                "shields": design.effective_shields,
+                "speed": design.effective_speed,
+                "range": design.effective_range,
+                "scrap_value": design.scrap_value,
+            }
+
+        ships_list.append({
+            "id": ship_id,
+            "fleet_id": fleet_id,
+            "fleet_name": fleet_name,
+            **fields,
+            "fuel": fuel,
+            "max_fuel": max_fuel,
+            "health_percent": design.health_percent_for(damage),
+        })
 
-    return jsonify({
+    return tag_response(jsonify({
         "planet_id": planet_id,
         "ships": ships_list,
-    })
+    }), etag)
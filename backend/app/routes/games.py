@@ -1,17 +1,45 @@
 """
 Game management routes
 """
-from flask import request, jsonify, g
-from pydantic import BaseModel, Field
-from typing import Literal, Optional
+import orjson
+from flask import current_app, request, jsonify, g
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy.orm import defer, selectinload
+from typing import List, Literal, Optional
 
+from app import db
 from app.routes import api_bp
-from app.services.auth import token_required
+from app.services.auth import (
+    token_required, get_current_game, get_current_player_in_game, get_current_players,
+)
 from app.services import GameService
-from app.models import Game, GameStatus
-
-
-# Pydantic schemas for validation
+from app.utils.cache import cache_get, cache_get_or_set_swr, cache_set
+from app.utils.errors import validation_error_response
+from app.utils.http import etagged, not_modified, revision_etag, tag_response
+from app.utils.json_response import make_json_response
+from app.utils.json_stream import stream_json
+from app.utils.loading import loader_options
+from app.utils.replica import has_read_replica, read_replica
+from app.models import GamePlayer, GameStatus, Fleet, Planet, PlanetState, Ship
+
+# Lobby list: fresh for a few seconds, then served stale while one request
+# refreshes it (the lobby page polls it)
+LOBBY_CACHE_TTL = 3
+LOBBY_CACHE_STALE_TTL = 10
+# Serialized details of a lobby game (invalidated by GameService)
+LOBBY_GAME_CACHE_TTL = 300
+
+
+# Map fleets: travel_path (a JSON list per fleet) is never sent, skip
+# fetching and decoding it
+_MAP_FLEET_LOADS = (
+    defer(Fleet.travel_path, raiseload=True),
+    selectinload(Fleet.ships).joinedload(Ship.design),
+)
+
+
+# Pydantic schemas for validation of request bodies (untrusted input) only:
+# responses come from to_dict() on DB rows and are never re-validated
 class CreateGameSchema(BaseModel):
     """Schema for creating a new game."""
     name: str = Field(min_length=3, max_length=100)
@@ -35,6 +63,11 @@ class SetReadySchema(BaseModel):
     ready: bool = True
 
 
+class BatchGamesSchema(BaseModel):
+    """Schema for fetching several games at once."""
+    ids: List[int] = Field(min_length=1, max_length=20)
+
+
 class UpdateGameSchema(BaseModel):
     """Schema for updating game configuration."""
     name: Optional[str] = Field(default=None, min_length=3, max_length=100)
@@ -105,9 +138,9 @@ def create_game():
         description: Données invalides
     """
     try:
-        data = CreateGameSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = CreateGameSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
     try:
         game = GameService.create_game(
@@ -146,15 +179,40 @@ def list_games():
               type: array
               items:
                 type: object
+      304:
+        description: Lobby inchangé depuis l'ETag envoyé (If-None-Match)
     """
-    games = GameService.get_lobby_games()
-    return jsonify({
-        "games": [game.to_dict() for game in games]
-    })
+    def build_lobby():
+        games = GameService.get_lobby_games()
+        player_counts = GameService.count_players(game.id for game in games)
+        return orjson.dumps({
+            "games": [game.to_dict(player_count=player_counts.get(game.id, 0)) for game in games]
+        })
+
+    # The version is read before the games: a list built from older rows can
+    # only be stored under an older version, never served as the current one
+    version = GameService.lobby_version()
+    if version is None:
+        with read_replica():
+            return make_json_response(build_lobby())
+
+    # An idle lobby is answered from Redis alone, without touching the DB.
+    # The list is then built once per version, from the primary: a lagging
+    # replica would pin an outdated list to the current ETag.
+    etag = revision_etag("lobby", version)
+    response = not_modified(etag)
+    if response:
+        return response
+
+    body = cache_get_or_set_swr(
+        GameService.lobby_cache_key(version), build_lobby, LOBBY_CACHE_TTL, LOBBY_CACHE_STALE_TTL
+    )
+    return tag_response(make_json_response(body), etag)
 
 
 @api_bp.route("/games/<int:game_id>", methods=["GET"])
 @token_required
+@etagged
 def get_game(game_id: int):
     """
     Obtenir les détails d'une partie
@@ -174,24 +232,78 @@ def get_game(game_id: int):
       404:
         description: Partie non trouvée
     """
+    # A lobby game only changes through GameService, which bumps its revision
+    # after each commit. The revision is read first: a copy built from a
+    # pre-commit read lands under the old key, never the current one.
+    version = GameService.game_version(game_id)
+    cache_key = None if version is None else GameService.lobby_game_cache_key(game_id, version)
+    cached = cache_key and cache_get(cache_key)
+    if cached:
+        return make_json_response(cached)
+
     try:
-        game = GameService.get_game_details(game_id)
-        if not game:
-            return jsonify({"error": "Game not found"}), 404
+        with read_replica():
+            game = GameService.get_game_details(game_id)
+            if not game:
+                return jsonify({"error": "Game not found"}), 404
+
+            # Players loaded once, also gives the count
+            response = GameService.game_details(game, game.players.all())
+
+        # Players' resources change every turn: only lobby details are cached.
+        # A lagging replica could store a just-invalidated state for the whole
+        # TTL, so they are only cached when read from the primary.
+        if cache_key is None or game.status != GameStatus.LOBBY.value or has_read_replica():
+            return make_json_response(response)
+
+        body = orjson.dumps(response)
+        cache_set(cache_key, body, LOBBY_GAME_CACHE_TTL)
+        return make_json_response(body)
+    except Exception as e:
+        current_app.logger.exception("get_game failed for %s", game_id)
+        return jsonify({"error": str(e)}), 500
 
-        # Include players in response
-        response = game.to_dict()
-        response["players"] = [player.to_dict() for player in game.players]
 
-        # Include galaxy info if game has started
-        if game.galaxy:
-            response["galaxy"] = game.galaxy.to_dict()
+@api_bp.route("/games/batch", methods=["POST"])
+@token_required
+def get_games_batch():
+    """
+    Obtenir les détails de plusieurs parties en une requête
+    ---
+    tags:
+      - Parties
+    security:
+      - Bearer: []
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+              minItems: 1
+              maxItems: 20
+    responses:
+      200:
+        description: Détails des parties trouvées, indexés par id
+      400:
+        description: Données invalides
+    """
+    try:
+        data = BatchGamesSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
-        return jsonify(response)
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return jsonify({"error": str(e)}), 500
+    games = GameService.get_games_bulk(set(data.ids))
+    return make_json_response({
+        "games": {game.id: GameService.game_details(game, players) for game, players in games}
+    })
 
 
 @api_bp.route("/games/<int:game_id>", methods=["PATCH"])
@@ -249,9 +361,9 @@ def update_game(game_id: int):
         description: Partie non trouvée
     """
     try:
-        data = UpdateGameSchema(**(request.json or {}))
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = UpdateGameSchema.model_validate_json(request.get_data(cache=False) or b"{}")
+    except ValidationError as e:
+        return validation_error_response(e)
 
     try:
         game = GameService.update_game(
@@ -266,16 +378,12 @@ def update_game(game_id: int):
             alliances_enabled=data.alliances_enabled,
             combat_luck_enabled=data.combat_luck_enabled,
         )
-        response = game.to_dict()
-        response["players"] = [player.to_dict() for player in game.players]
+        players = game.players.all()
+        response = game.to_dict(player_count=len(players))
+        response["players"] = [player.to_dict() for player in players]
         return jsonify(response)
     except ValueError as e:
-        error_msg = str(e)
-        if "not found" in error_msg.lower():
-            return jsonify({"error": error_msg}), 404
-        if "admin" in error_msg.lower():
-            return jsonify({"error": error_msg}), 403
-        return jsonify({"error": error_msg}), 400
+        return jsonify({"error": str(e)}), 400
 
 
 @api_bp.route("/games/<int:game_id>", methods=["DELETE"])
@@ -305,12 +413,7 @@ def delete_game(game_id: int):
         GameService.delete_game(game_id, g.current_user.id)
         return jsonify({"message": "Game deleted"})
     except ValueError as e:
-        error_msg = str(e)
-        if "not found" in error_msg.lower():
-            return jsonify({"error": error_msg}), 404
-        if "admin" in error_msg.lower():
-            return jsonify({"error": error_msg}), 403
-        return jsonify({"error": error_msg}), 400
+        return jsonify({"error": str(e)}), 400
 
 
 @api_bp.route("/games/<int:game_id>/join", methods=["POST"])
@@ -340,10 +443,7 @@ def join_game(game_id: int):
         player = GameService.join_game(game_id, g.current_user.id)
         return jsonify(player.to_dict())
     except ValueError as e:
-        error_msg = str(e)
-        if "not found" in error_msg.lower():
-            return jsonify({"error": error_msg}), 404
-        return jsonify({"error": error_msg}), 400
+        return jsonify({"error": str(e)}), 400
 
 
 @api_bp.route("/games/<int:game_id>/leave", methods=["POST"])
@@ -366,6 +466,8 @@ def leave_game(game_id: int):
         description: Partie quittée
       400:
         description: Impossible de quitter
+      404:
+        description: Partie non trouvée
     """
     try:
         GameService.leave_game(game_id, g.current_user.id)
@@ -406,22 +508,20 @@ def add_ai_player(game_id: int):
         description: IA ajoutée
       400:
         description: Impossible d'ajouter l'IA
+      403:
+        description: Non autorisé
+      404:
+        description: Partie non trouvée
     """
     try:
-        data = AddAISchema(**(request.json or {}))
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
-
-    # Check if user is admin of the game
-    game = Game.query.get(game_id)
-    if not game:
-        return jsonify({"error": "Game not found"}), 404
-    if game.admin_user_id != g.current_user.id:
-        return jsonify({"error": "Only game admin can add AI players"}), 403
+        data = AddAISchema.model_validate_json(request.get_data(cache=False) or b"{}")
+    except ValidationError as e:
+        return validation_error_response(e)
 
     try:
         player = GameService.add_ai_player(
             game_id=game_id,
+            admin_user_id=g.current_user.id,
             difficulty=data.difficulty,
             name=data.name,
         )
@@ -456,15 +556,11 @@ def remove_ai_player(game_id: int, player_id: int):
         description: Erreur
       403:
         description: Non autorisé
+      404:
+        description: Partie non trouvée
     """
-    game = Game.query.get(game_id)
-    if not game:
-        return jsonify({"error": "Game not found"}), 404
-    if game.admin_user_id != g.current_user.id:
-        return jsonify({"error": "Only game admin can remove AI players"}), 403
-
     try:
-        GameService.remove_ai_player(game_id, player_id)
+        GameService.remove_ai_player(game_id, player_id, g.current_user.id)
         return jsonify({"message": "AI player removed"})
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
@@ -500,9 +596,9 @@ def set_ready(game_id: int):
         description: Erreur
     """
     try:
-        data = SetReadySchema(**(request.json or {}))
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = SetReadySchema.model_validate_json(request.get_data(cache=False) or b"{}")
+    except ValidationError as e:
+        return validation_error_response(e)
 
     try:
         player = GameService.set_player_ready(game_id, g.current_user.id, data.ready)
@@ -533,19 +629,13 @@ def start_game(game_id: int):
         description: Impossible de démarrer
       403:
         description: Non autorisé
+      404:
+        description: Partie non trouvée
     """
     try:
-        game = GameService.start_game(game_id, g.current_user.id)
-        response = game.to_dict()
-        response["players"] = [player.to_dict() for player in game.players]
-        if game.galaxy:
-            response["galaxy"] = game.galaxy.to_dict()
-        return jsonify(response)
+        return make_json_response(GameService.start_game(game_id, g.current_user.id))
     except ValueError as e:
-        error_msg = str(e)
-        if "admin" in error_msg.lower():
-            return jsonify({"error": error_msg}), 403
-        return jsonify({"error": error_msg}), 400
+        return jsonify({"error": str(e)}), 400
 
 
 @api_bp.route("/games/<int:game_id>/map", methods=["GET"])
@@ -571,18 +661,14 @@ def get_game_map(game_id: int):
       404:
         description: Partie non trouvée
     """
-    from app.models import GamePlayer, Fleet
 
     # Vérifier que la partie existe
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
     # Vérifier que l'utilisateur participe à cette partie
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not a player in this game"}), 403
@@ -596,21 +682,23 @@ def get_game_map(game_id: int):
     if not galaxy:
         return jsonify({"error": "Galaxy not generated"}), 500
 
-    # Planètes
-    planets_data = [planet.to_dict() for planet in galaxy.planets]
+    # Planètes (lues directement en lignes, sans objets ORM)
+    planets_data = Planet.dicts_for_galaxy(galaxy.id)
 
     # Flottes visibles (les siennes + celles sur ses planètes)
     # Pour l'instant, on retourne toutes les flottes du jeu (fog of war à implémenter plus tard)
     all_fleets = Fleet.query.join(GamePlayer).filter(
         GamePlayer.game_id == game_id
-    ).all()
+    ).options(*loader_options(*_MAP_FLEET_LOADS)).all()
 
-    fleets_data = [fleet.to_dict() for fleet in all_fleets]
+    # Sérialisées une à une pendant l'envoi
+    fleets_data = (fleet.to_dict() for fleet in all_fleets)
 
     # Tous les joueurs (pour les couleurs)
     players_data = [p.to_dict() for p in game.players]
 
-    return jsonify({
+    # Envoyée par morceaux : pas de document complet en mémoire
+    return stream_json({
         "game_id": game_id,
         "turn": game.current_turn,
         "my_player_id": player.id,
@@ -641,18 +729,21 @@ def my_games():
       200:
         description: Liste des parties du joueur
     """
-    from app.models import GamePlayer
 
     # Get all games where user is a player
-    player_entries = GamePlayer.query.filter_by(user_id=g.current_user.id).all()
-    games = []
+    # Players come with their game in one query; counts in one more
+    with read_replica():
+        player_entries = list(get_current_players().values())
+        player_counts = GameService.count_players(player.game_id for player in player_entries)
 
-    for player in player_entries:
-        game_data = player.game.to_dict()
-        game_data["my_player"] = player.to_dict()
-        games.append(game_data)
+    def games():
+        for player in player_entries:
+            game_data = player.game.to_dict(player_count=player_counts.get(player.game_id, 0))
+            game_data["my_player"] = player.to_dict()
+            yield game_data
 
-    return jsonify({"games": games})
+    # Each game is serialized and sent as it is built
+    return stream_json({"games": games()})
 
 
 @api_bp.route("/games/<int:game_id>/debug/conquer-all", methods=["POST"])
@@ -666,17 +757,12 @@ def debug_conquer_all(game_id: int):
     security:
       - Bearer: []
     """
-    from app import db
-    from app.models import GamePlayer, Planet, PlanetState
 
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not a player in this game"}), 403
@@ -707,17 +793,12 @@ def debug_add_resources(game_id: int):
     security:
       - Bearer: []
     """
-    from app import db
-    from app.models import GamePlayer, Planet
 
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not a player in this game"}), 403
@@ -1,8 +1,13 @@
 """
 Routes OAuth (Google).
 """
+from itertools import chain, count
+
+import orjson
 from flask import jsonify, request, redirect, current_app, url_for
 from authlib.integrations.requests_client import OAuth2Session
+from requests.adapters import HTTPAdapter
+from sqlalchemy import select
 
 from app import db
 from app.routes import api_bp
@@ -14,14 +19,21 @@ GOOGLE_AUTHORIZE_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v3/userinfo"
 
+# Pool de connexions HTTPS partagé par tous les clients : les connexions
+# keep-alive vers Google restent ouvertes d'un callback à l'autre (l'adapter
+# est thread-safe, contrairement à la session qui porte le token)
+_google_http = HTTPAdapter()
+
 
 def get_google_client():
-    """Crée un client OAuth2 pour Google."""
-    return OAuth2Session(
+    """Crée un client OAuth2 pour Google (un par requête, pool partagé)."""
+    client = OAuth2Session(
         client_id=current_app.config["GOOGLE_CLIENT_ID"],
         client_secret=current_app.config["GOOGLE_CLIENT_SECRET"],
         redirect_uri=current_app.config["GOOGLE_REDIRECT_URI"],
     )
+    client.mount("https://", _google_http)
+    return client
 
 
 @api_bp.route("/auth/google", methods=["GET"])
@@ -94,7 +106,7 @@ def google_callback():
         # Récupérer les infos utilisateur
         client.token = token
         resp = client.get(GOOGLE_USERINFO_URL)
-        userinfo = resp.json()
+        userinfo = orjson.loads(resp.content)
 
         google_id = userinfo.get("sub")
         email = userinfo.get("email")
@@ -104,11 +116,13 @@ def google_callback():
         if not email:
             return jsonify({"error": "Email non fourni par Google"}), 400
 
-        # Chercher ou créer l'utilisateur
-        user = db.session.query(User).filter(
-            (User.oauth_provider == "google") & (User.oauth_id == google_id) |
-            (User.email == email.lower())
-        ).first()
+        # Chercher ou créer l'utilisateur : deux recherches indexées (un OR
+        # entre les deux conditions empêcherait l'usage des index)
+        user = db.session.execute(
+            select(User).filter_by(oauth_provider="google", oauth_id=google_id)
+        ).scalars().first() or db.session.execute(
+            select(User).filter_by(email=email.lower())
+        ).scalar_one_or_none()
 
         if user:
             # Utilisateur existant - mettre à jour les infos OAuth si nécessaire
@@ -122,14 +136,19 @@ def google_callback():
         else:
             # Nouvel utilisateur
             # Générer un pseudo unique à partir du nom
-            base_pseudo = name.replace(" ", "") if name else email.split("@")[0]
-            pseudo = base_pseudo[:20]
-
-            # Vérifier unicité du pseudo
-            counter = 1
-            while db.session.query(User).filter_by(pseudo=pseudo).first():
-                pseudo = f"{base_pseudo[:17]}{counter}"
-                counter += 1
+            # Un nom vide ou fait d'espaces donnerait un préfixe vide (la
+            # requête LIKE ci-dessous ramènerait alors tous les pseudos)
+            base_pseudo = "".join(name.split()) or email.split("@")[0] or "Joueur"
+
+            # Vérifier unicité du pseudo : tous les candidats commencent par
+            # base_pseudo[:17], une seule requête ramène ceux déjà pris
+            used = set(db.session.execute(
+                select(User.pseudo).where(User.pseudo.startswith(base_pseudo[:17], autoescape=True))
+            ).scalars())
+            candidates = chain(
+                [base_pseudo[:20]], (f"{base_pseudo[:17]}{counter}" for counter in count(1))
+            )
+            pseudo = next(candidate for candidate in candidates if candidate not in used)
 
             user = User(
                 email=email.lower(),
@@ -1,16 +1,24 @@
 """
 Technology management routes
 """
-from flask import request, jsonify, g
-from pydantic import BaseModel, Field
+from flask import current_app, request, jsonify
+from pydantic import BaseModel, Field, ValidationError
 
 from app import db
 from app.routes import api_bp
-from app.services.auth import token_required
+from app.services.auth import (
+    token_required, get_current_game, get_current_player, get_current_player_in_game,
+)
 from app.services.technology import TechnologyService
-from app.models import Game, GamePlayer, GameStatus
+from app.utils.cache import cache_get, cache_set
+from app.utils.errors import validation_error_response
+from app.models import GameStatus
 from app.models.technology import RadicalBreakthrough
 
+# Seconds max levels / comparison stay cached (keys also change every turn
+# and with the game's technology revision)
+TECH_CACHE_TTL = 60
+
 
 # =============================================================================
 # Pydantic Schemas
@@ -58,20 +66,22 @@ def get_technology(game_id: int):
       404:
         description: Partie non trouvee
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
 
+    # Technology is created lazily on first access: only then is there a write
+    created = player.technology is None
     summary = TechnologyService.get_player_tech_summary(player)
-    db.session.commit()  # Commit in case tech was created
+    if created:
+        db.session.commit()
+        # The new record adds this player to opponents' comparisons
+        TechnologyService.invalidate_game_tech(game_id)
 
     return jsonify(summary)
 
@@ -137,21 +147,18 @@ def update_research_budget(game_id: int):
         description: Non membre de la partie
     """
     try:
-        data = ResearchBudgetSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = ResearchBudgetSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
     if game.status != GameStatus.RUNNING.value:
         return jsonify({"error": "Game is not running"}), 400
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
@@ -159,7 +166,8 @@ def update_research_budget(game_id: int):
     if player.is_eliminated:
         return jsonify({"error": "You have been eliminated"}), 400
 
-    success, message = TechnologyService.update_research_budget(
+    created = player.technology is None
+    success, message, budget = TechnologyService.update_research_budget(
         player,
         data.range_budget,
         data.speed_budget,
@@ -171,10 +179,12 @@ def update_research_budget(game_id: int):
 
     if success:
         db.session.commit()
+        if created:
+            TechnologyService.invalidate_game_tech(game_id)
         return jsonify({
             "success": True,
             "message": message,
-            "budget": player.technology.to_dict()["budget"],
+            "budget": budget,
         })
     else:
         return jsonify({"error": message}), 400
@@ -203,20 +213,27 @@ def get_technology_comparison(game_id: int):
       404:
         description: Partie non trouvee
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
 
+    # Revision read first: a copy built from a pre-commit read lands under the old key
+    version = TechnologyService.tech_version(game_id)
+    cache_key = None if version is None else TechnologyService.comparison_cache_key(player, version)
+    cached = cache_key and cache_get(cache_key)
+    if cached:
+        return current_app.response_class(cached, mimetype="application/json")
+
     comparison = TechnologyService.get_technology_comparison(game, player)
-    return jsonify(comparison)
+    response = jsonify(comparison)
+    if cache_key:
+        cache_set(cache_key, response.get_data(), TECH_CACHE_TTL)
+    return response
 
 
 @api_bp.route("/games/<int:game_id>/technology/max-levels", methods=["GET"])
@@ -240,20 +257,27 @@ def get_max_tech_levels(game_id: int):
       403:
         description: Non membre de la partie
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
 
+    # Revision read first: a copy built from a pre-commit read lands under the old key
+    version = TechnologyService.tech_version(game_id)
+    cache_key = None if version is None else TechnologyService.max_levels_cache_key(player, version)
+    cached = cache_key and cache_get(cache_key)
+    if cached:
+        return current_app.response_class(cached, mimetype="application/json")
+
     max_levels = TechnologyService.get_max_tech_levels(player)
-    return jsonify({"max_levels": max_levels})
+    response = jsonify({"max_levels": max_levels})
+    if cache_key:
+        cache_set(cache_key, response.get_data(), TECH_CACHE_TTL)
+    return response
 
 
 # =============================================================================
@@ -281,14 +305,11 @@ def get_pending_breakthroughs(game_id: int):
       403:
         description: Non membre de la partie
     """
-    game = Game.query.get(game_id)
+    game = get_current_game(game_id)
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    player = GamePlayer.query.filter_by(
-        game_id=game_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player_in_game(game_id)
 
     if not player:
         return jsonify({"error": "You are not in this game"}), 403
@@ -340,25 +361,23 @@ def eliminate_breakthrough_option(breakthrough_id: int):
         description: Percee non trouvee
     """
     try:
-        data = EliminateBreakthroughSchema(**request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        data = EliminateBreakthroughSchema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        return validation_error_response(e)
 
-    breakthrough = RadicalBreakthrough.query.get(breakthrough_id)
+    breakthrough = db.session.get(RadicalBreakthrough, breakthrough_id)
     if not breakthrough:
         return jsonify({"error": "Breakthrough not found"}), 404
 
     # Find the player who owns this breakthrough
-    player = GamePlayer.query.filter_by(
-        id=breakthrough.player_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player(breakthrough.player_id)
 
     if not player:
         return jsonify({"error": "This breakthrough does not belong to you"}), 403
 
     # Get current game turn
-    game = Game.query.get(player.game_id)
+    game = player.game
+    game_id = game.id
 
     success, message, result = TechnologyService.eliminate_breakthrough_option(
         player,
@@ -369,6 +388,8 @@ def eliminate_breakthrough_option(breakthrough_id: int):
 
     if success:
         db.session.commit()
+        # A temporary bonus raises the effective (max) levels
+        TechnologyService.invalidate_game_tech(game_id)
         return jsonify({
             "success": True,
             "message": message,
@@ -401,15 +422,12 @@ def get_breakthrough(breakthrough_id: int):
       404:
         description: Percee non trouvee
     """
-    breakthrough = RadicalBreakthrough.query.get(breakthrough_id)
+    breakthrough = db.session.get(RadicalBreakthrough, breakthrough_id)
     if not breakthrough:
         return jsonify({"error": "Breakthrough not found"}), 404
 
     # Check ownership
-    player = GamePlayer.query.filter_by(
-        id=breakthrough.player_id,
-        user_id=g.current_user.id
-    ).first()
+    player = get_current_player(breakthrough.player_id)
 
     if not player:
         return jsonify({"error": "This breakthrough does not belong to you"}), 403
@@ -1,14 +1,17 @@
 """
 Routes utilisateur.
 """
+import uuid
+from datetime import datetime
 from functools import wraps
 from flask import jsonify, request
 from pydantic import ValidationError
 
+from app import db
 from app.routes import api_bp
-from app.services.auth import get_user_from_token
+from app.services.auth import get_user_from_token, invalidate_active_user
 from app.schemas.auth import UpdateProfileSchema
-from app.utils.errors import AuthenticationError, ValidationError as APIValidationError
+from app.utils.errors import AuthenticationError, ValidationError as APIValidationError, validation_error_response
 
 
 def auth_required(f):
@@ -20,12 +23,12 @@ def auth_required(f):
         if not auth_header:
             return jsonify({"error": "Token d'authentification requis"}), 401
 
-        parts = auth_header.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        # Schéma et token séparés par un ou plusieurs espaces (RFC 7235 : SP)
+        scheme, _, token = auth_header.partition(" ")
+        token = token.strip(" ")
+        if scheme.lower() != "bearer" or not token or " " in token:
             return jsonify({"error": "Format d'authentification invalide"}), 401
 
-        token = parts[1]
-
         try:
             user = get_user_from_token(token, token_type="access")
             request.current_user = user
@@ -130,15 +133,11 @@ def update_current_user():
       401:
         description: Non authentifié
     """
-    from app import db
 
     try:
-        data = UpdateProfileSchema(**request.get_json())
+        data = UpdateProfileSchema.model_validate_json(request.get_data(cache=False))
     except ValidationError as e:
-        errors = e.errors()
-        if errors:
-            return jsonify({"error": errors[0]["msg"]}), 400
-        return jsonify({"error": "Données invalides"}), 400
+        return validation_error_response(e)
 
     user = request.current_user
     updated = False
@@ -192,10 +191,6 @@ def delete_current_user():
       401:
         description: Non authentifié
     """
-    from datetime import datetime
-    import uuid
-    from app import db
-
     user = request.current_user
 
     # Soft delete: anonymize data and mark as deleted
@@ -211,6 +206,7 @@ def delete_current_user():
     user.reset_token_expires = None
 
     db.session.commit()
+    invalidate_active_user(user.id)
 
     return jsonify({
         "message": "Compte supprimé avec succès. Vos données ont été anonymisées."
@@ -2,7 +2,13 @@
 Schémas Pydantic pour l'authentification.
 """
 import re
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+
+# Motifs compilés une fois pour tous les validateurs
+_UPPERCASE_RE = re.compile(r"[A-Z]")
+_LOWERCASE_RE = re.compile(r"[a-z]")
+_DIGIT_RE = re.compile(r"\d")
+_PSEUDO_RE = re.compile(r"^[a-zA-Z0-9_\- ]+$")
 
 
 class RegisterSchema(BaseModel):
@@ -17,11 +23,11 @@ class RegisterSchema(BaseModel):
     def validate_password(cls, v: str) -> str:
         if len(v) < 8:
             raise ValueError("Le mot de passe doit contenir au moins 8 caractères")
-        if not re.search(r"[A-Z]", v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError("Le mot de passe doit contenir au moins une majuscule")
-        if not re.search(r"[a-z]", v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError("Le mot de passe doit contenir au moins une minuscule")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Le mot de passe doit contenir au moins un chiffre")
         return v
 
@@ -33,7 +39,7 @@ class RegisterSchema(BaseModel):
             raise ValueError("Le pseudo doit contenir au moins 3 caractères")
         if len(v) > 30:
             raise ValueError("Le pseudo ne doit pas dépasser 30 caractères")
-        if not re.match(r"^[a-zA-Z0-9_\- ]+$", v):
+        if not _PSEUDO_RE.match(v):
             raise ValueError("Le pseudo ne peut contenir que des lettres, chiffres, espaces, tirets et underscores")
         return v
 
@@ -68,8 +74,7 @@ class UserResponse(BaseModel):
     avatar_url: str | None = None
     is_verified: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UpdateProfileSchema(BaseModel):
@@ -88,7 +93,7 @@ class UpdateProfileSchema(BaseModel):
             raise ValueError("Le pseudo doit contenir au moins 3 caractères")
         if len(v) > 30:
             raise ValueError("Le pseudo ne doit pas dépasser 30 caractères")
-        if not re.match(r"^[a-zA-Z0-9_\- ]+$", v):
+        if not _PSEUDO_RE.match(v):
             raise ValueError("Le pseudo ne peut contenir que des lettres, chiffres, espaces, tirets et underscores")
         return v
 
@@ -124,10 +129,10 @@ class ResetPasswordSchema(BaseModel):
     def validate_password(cls, v: str) -> str:
         if len(v) < 8:
             raise ValueError("Le mot de passe doit contenir au moins 8 caractères")
-        if not re.search(r"[A-Z]", v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError("Le mot de passe doit contenir au moins une majuscule")
-        if not re.search(r"[a-z]", v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError("Le mot de passe doit contenir au moins une minuscule")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Le mot de passe doit contenir au moins un chiffre")
         return v
@@ -4,12 +4,14 @@ AI Expansion Service for Colonie-IA.
 Handles colonization decisions and expansion strategy.
 """
 import logging
+import math
+from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
 from app import db
 from app.models import (
-    GamePlayer, Planet, Fleet, PlanetState, FleetStatus, ShipType
+    GamePlayer, Planet, Fleet, PlanetState, OWNED_PLANET_STATES, FleetStatus, ShipType
 )
 
 logger = logging.getLogger(__name__)
@@ -76,7 +78,7 @@ class AIExpansionService:
 
         for planet in game.galaxy.planets:
             # Skip already owned planets
-            if planet.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+            if planet.state in OWNED_PLANET_STATES:
                 continue
 
             # Calculate distance from nearest owned planet
@@ -241,12 +243,12 @@ class AIExpansionService:
             return False, "Fleet has no colony ship"
 
         # Verify planet is not already colonized
-        if planet.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+        if planet.state in OWNED_PLANET_STATES:
             return False, "Planet is already colonized"
 
         # Find and consume the colony ship
         colony_ship = None
-        for ship in fleet.ships.filter_by(is_destroyed=False):
+        for ship in fleet.active_ships():
             if ship.design.ship_type == ShipType.COLONY.value:
                 colony_ship = ship
                 break
@@ -268,7 +270,6 @@ class AIExpansionService:
         planet.ships_budget = 33
 
         # Destroy colony ship (settlers disembark)
-        from datetime import datetime
         colony_ship.is_destroyed = True
         colony_ship.destroyed_at = datetime.utcnow()
 
@@ -286,7 +287,7 @@ class AIExpansionService:
     def _get_home_planet(player: GamePlayer) -> Optional[Planet]:
         """Get the player's home planet (first colonized planet)."""
         for planet in player.planets:
-            if planet.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+            if planet.state in OWNED_PLANET_STATES:
                 return planet
         return None
 
@@ -298,13 +299,11 @@ class AIExpansionService:
         Returns:
             Tuple of (distance, nearest_planet)
         """
-        import math
-
         min_distance = float('inf')
         nearest = None
 
         for planet in player.planets:
-            if planet.state not in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+            if planet.state not in OWNED_PLANET_STATES:
                 continue
 
             dx = target.x - planet.x
@@ -12,7 +12,7 @@ from typing import Dict, List, Any, Optional
 from app import db
 from app.models import (
     GamePlayer, Planet, Fleet, Game,
-    PlanetState, FleetStatus, ShipType, ShipDesign,
+    OWNED_PLANET_STATES, FleetStatus, ShipType, ShipDesign, ProductionQueue,
 )
 from app.services.ai.ai_difficulty import (
     AIDifficultyLevel, DifficultyModifiers, map_legacy_difficulty
@@ -64,7 +64,8 @@ class AIService:
             f"[AI-{difficulty.value}] Turn {analysis.current_turn}: "
             f"Processing player {player.player_name}"
         )
-        logger.debug(f"[AI] Analysis summary: {analysis.get_summary()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[AI] Analysis summary: %s", analysis.get_summary())
 
         # Initialize results
         results = {
@@ -86,27 +87,27 @@ class AIService:
             # On error, just skip most decisions
             return results
 
+        # Decisions go in a SAVEPOINT: a failing AI only loses its own changes,
+        # and everything is committed once with the rest of the turn
         try:
-            # 1. Handle pending radical breakthroughs
-            AIService._handle_radical_breakthroughs(player, analysis, modifiers, results)
+            with db.session.begin_nested():
+                # 1. Handle pending radical breakthroughs
+                AIService._handle_radical_breakthroughs(player, analysis, modifiers, results)
 
-            # 2. Allocate research budget
-            AIService._allocate_research(player, analysis, modifiers, results)
+                # 2. Allocate research budget
+                AIService._allocate_research(player, analysis, modifiers, results)
 
-            # 3. Allocate planet budgets
-            AIService._allocate_planet_budgets(player, analysis, modifiers, results)
+                # 3. Allocate planet budgets
+                AIService._allocate_planet_budgets(player, analysis, modifiers, results)
 
-            # 4. Queue ship production
-            AIService._plan_production(player, analysis, modifiers, results)
+                # 4. Queue ship production
+                AIService._plan_production(player, analysis, modifiers, results)
 
-            # 5. Plan fleet movements
-            AIService._plan_fleet_movements(player, analysis, modifiers, results)
-
-            db.session.commit()
+                # 5. Plan fleet movements
+                AIService._plan_fleet_movements(player, analysis, modifiers, results)
 
         except Exception as e:
             logger.error(f"[AI] Error processing turn for player {player.id}: {e}")
-            db.session.rollback()
             results["error"] = str(e)
 
         return results
@@ -411,7 +412,6 @@ class AIService:
         Only queues if player has resources and queue is not too full.
         """
         from app.services.economy import EconomyService
-        from app.models import ProductionQueue
 
         # Ensure player has ship designs
         AIService._ensure_ship_designs(player)
@@ -678,8 +678,8 @@ class AIService:
 
             try:
                 # Get fleet and destination objects
-                fleet = Fleet.query.get(fleet_id)
-                destination = Planet.query.get(destination_id)
+                fleet = db.session.get(Fleet, fleet_id)
+                destination = db.session.get(Planet, destination_id)
 
                 if not fleet or not destination:
                     raise ValueError(f"Fleet {fleet_id} or destination {destination_id} not found")
@@ -738,7 +738,7 @@ class AIService:
             return False
 
         # Check if planet is uncolonized and fleet can colonize
-        if planet.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+        if planet.state in OWNED_PLANET_STATES:
             return False
 
         if not fleet.can_colonize:
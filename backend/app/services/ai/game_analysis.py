@@ -11,7 +11,7 @@ import math
 
 from app.models import (
     GamePlayer, Planet, Fleet, Game,
-    PlanetState, FleetStatus, ShipType,
+    PlanetState, OWNED_PLANET_STATES, FleetStatus, ShipType,
 )
 
 
@@ -166,7 +166,7 @@ class GameAnalysis:
         income = 0
         metal_prod = 0
         for planet in player.planets:
-            if planet.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+            if planet.state in OWNED_PLANET_STATES:
                 # Estimate income based on population
                 income += max(0, planet.population // 1000 - 50)
                 # Estimate metal production
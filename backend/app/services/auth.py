@@ -2,13 +2,18 @@
 Service d'authentification : hashage de mot de passe et gestion JWT.
 """
 import jwt
+import secrets
 from functools import wraps
 from datetime import datetime, timedelta, timezone
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from flask import current_app, request, g, jsonify
+from sqlalchemy.orm import selectinload
 
+from app import db
+from app.models.game import Game, GamePlayer
 from app.models.user import User
+from app.utils.cache import cache_delete, cache_get, cache_set
 from app.utils.errors import AuthenticationError
 
 # Instance du hasher Argon2
@@ -68,8 +73,8 @@ def decode_token(token: str) -> dict:
         raise AuthenticationError("Token invalide")
 
 
-def get_user_from_token(token: str, token_type: str = "access") -> User:
-    """Récupère l'utilisateur à partir d'un token."""
+def get_user_id_from_token(token: str, token_type: str = "access") -> int:
+    """Décode un token et retourne l'identifiant utilisateur qu'il contient."""
     payload = decode_token(token)
 
     if payload.get("type") != token_type:
@@ -80,11 +85,18 @@ def get_user_from_token(token: str, token_type: str = "access") -> User:
         raise AuthenticationError("Token invalide: pas d'identifiant utilisateur")
 
     try:
-        user_id = int(user_id_str)
+        return int(user_id_str)
     except ValueError:
         raise AuthenticationError("Token invalide: identifiant utilisateur malformé")
 
-    from app import db
+
+def get_user_from_token(token: str, token_type: str = "access") -> User:
+    """Récupère l'utilisateur à partir d'un token."""
+    return get_active_user(get_user_id_from_token(token, token_type))
+
+
+def get_active_user(user_id: int) -> User:
+    """Charge un utilisateur et vérifie que son compte est utilisable."""
     user = db.session.get(User, user_id)
 
     if not user:
@@ -101,7 +113,6 @@ def get_user_from_token(token: str, token_type: str = "access") -> User:
 
 def authenticate_user(email: str, password: str) -> User:
     """Authentifie un utilisateur par email/mot de passe."""
-    from app import db
 
     user = db.session.query(User).filter_by(email=email.lower()).first()
 
@@ -125,13 +136,11 @@ def authenticate_user(email: str, password: str) -> User:
 
 def generate_reset_token() -> str:
     """Génère un token de réinitialisation de mot de passe."""
-    import secrets
     return secrets.token_urlsafe(32)
 
 
 def verify_reset_token(token: str) -> User | None:
     """Vérifie un token de réinitialisation et retourne l'utilisateur."""
-    from app import db
 
     user = db.session.query(User).filter_by(reset_token=token).first()
 
@@ -154,6 +163,33 @@ def verify_reset_token(token: str) -> User | None:
     return user
 
 
+def _active_user_cache_key(user_id: int) -> str:
+    return f"user:{user_id}:active"
+
+
+def invalidate_active_user(user_id: int):
+    """À appeler quand un compte est désactivé ou supprimé."""
+    cache_delete(_active_user_cache_key(user_id))
+
+
+class CurrentUser:
+    """
+    Utilisateur authentifié de la requête (g.current_user).
+
+    `id` vient du token ; tout autre attribut charge le User depuis la base
+    à la première utilisation.
+    """
+
+    def __init__(self, user_id: int, user: User = None):
+        self.id = user_id
+        self._user = user
+
+    def __getattr__(self, name):
+        if self._user is None:
+            self._user = db.session.get(User, self.id)
+        return getattr(self._user, name)
+
+
 def token_required(f):
     """Décorateur qui vérifie la présence et validité d'un token JWT."""
     @wraps(f)
@@ -163,19 +199,70 @@ def token_required(f):
         if not auth_header:
             return jsonify({"error": "Token manquant"}), 401
 
-        parts = auth_header.split()
-
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        # Schéma et token séparés par un ou plusieurs espaces (RFC 7235 : SP)
+        scheme, _, token = auth_header.partition(" ")
+        token = token.strip(" ")
+        if scheme.lower() != "bearer" or not token or " " in token:
             return jsonify({"error": "Format de token invalide"}), 401
 
-        token = parts[1]
-
         try:
-            user = get_user_from_token(token, token_type="access")
-            g.current_user = user
+            user_id = get_user_id_from_token(token, token_type="access")
+
+            # Un compte vérifié récemment n'est pas relu en base à chaque requête
+            cache_key = _active_user_cache_key(user_id)
+            if cache_get(cache_key):
+                g.current_user = CurrentUser(user_id)
+            else:
+                user = get_active_user(user_id)
+                ttl = int(current_app.config["JWT_ACCESS_TOKEN_EXPIRES"].total_seconds())
+                cache_set(cache_key, b"1", ttl)
+                g.current_user = CurrentUser(user_id, user)
+            # Joueurs de l'utilisateur, chargés à la demande (get_current_players)
+            g.pop("players_by_id", None)
         except AuthenticationError as e:
             return jsonify({"error": str(e)}), 401
 
         return f(*args, **kwargs)
 
     return decorated
+
+
+def get_current_players() -> dict:
+    """
+    Retourne les joueurs (GamePlayer) de l'utilisateur courant, indexés par id.
+
+    Chargés en une seule requête (avec leur partie) au premier appel, puis
+    mis en cache dans `g` pour le reste de la requête HTTP.
+    """
+    if "players_by_id" not in g:
+        players = GamePlayer.query.filter_by(
+            user_id=g.current_user.id
+        ).options(selectinload(GamePlayer.game)).all()
+        g.players_by_id = {p.id: p for p in players}
+    return g.players_by_id
+
+
+def get_current_player(player_id: int):
+    """Retourne le GamePlayer `player_id` s'il appartient à l'utilisateur courant."""
+    return get_current_players().get(player_id)
+
+
+def get_current_player_in_game(game_id: int):
+    """Retourne le GamePlayer de l'utilisateur courant dans la partie `game_id`."""
+    for player in get_current_players().values():
+        if player.game_id == game_id:
+            return player
+    return None
+
+
+def get_current_game(game_id: int):
+    """
+    Retourne la partie `game_id` (ou None).
+
+    Si l'utilisateur courant y joue, la partie est déjà chargée avec ses
+    joueurs (get_current_players) : aucune requête supplémentaire.
+    """
+    player = get_current_player_in_game(game_id)
+    if player:
+        return player.game
+    return db.session.get(Game, game_id)
@@ -256,15 +256,11 @@ class CombatService:
         # Collect all ships
         attacker_ships = []
         for fleet in attacker_fleets:
-            attacker_ships.extend(
-                fleet.ships.filter_by(is_destroyed=False).all()
-            )
+            attacker_ships.extend(fleet.active_ships())
 
         defender_ships = []
         for fleet in defender_fleets:
-            defender_ships.extend(
-                fleet.ships.filter_by(is_destroyed=False).all()
-            )
+            defender_ships.extend(fleet.active_ships())
 
         # All ships participate
         all_ships = [(ship, "attacker") for ship in attacker_ships] + \
@@ -436,7 +432,7 @@ class CombatService:
             if fleet.ship_count == 0:
                 continue
 
-            ships = list(fleet.ships.filter_by(is_destroyed=False).all())
+            ships = fleet.active_ships()
             if not ships:
                 continue
 
@@ -475,7 +471,7 @@ class CombatService:
         # Calculate total bombardment power
         total_weapons = 0
         for fleet in attacker_fleets:
-            for ship in fleet.ships.filter_by(is_destroyed=False):
+            for ship in fleet.active_ships():
                 if ship.design:
                     total_weapons += ship.design.effective_weapons
 
@@ -619,7 +615,7 @@ class CombatService:
         colony_fleet = None
 
         for fleet in attacker_fleets:
-            for ship in fleet.ships.filter_by(is_destroyed=False):
+            for ship in fleet.active_ships():
                 if ship.design and ship.design.ship_type == ShipType.COLONY.value:
                     colony_ship = ship
                     colony_fleet = fleet
@@ -660,7 +656,7 @@ class CombatService:
             if player_id not in forces:
                 forces[player_id] = {}
 
-            for ship in fleet.ships.filter_by(is_destroyed=False):
+            for ship in fleet.active_ships():
                 if ship.design:
                     ship_type = ship.design.ship_type
                     forces[player_id][ship_type] = forces[player_id].get(ship_type, 0) + 1
@@ -696,7 +692,7 @@ class CombatService:
         """Calculate losses for defender (single player)."""
         current = {}
         for fleet in fleets:
-            for ship in fleet.ships.filter_by(is_destroyed=False):
+            for ship in fleet.active_ships():
                 if ship.design:
                     ship_type = ship.design.ship_type
                     current[ship_type] = current.get(ship_type, 0) + 1
@@ -6,8 +6,9 @@ import math
 from typing import Dict, List, Optional, Tuple
 
 from datetime import datetime
+from sqlalchemy.orm import selectinload
 from app import db
-from app.models import GamePlayer, Planet, PlanetState, ProductionQueue, Ship, Fleet
+from app.models import GamePlayer, Planet, PlanetState, OWNED_PLANET_STATES, ProductionQueue, Ship, ShipDesign, Fleet
 
 
 # =============================================================================
@@ -118,7 +119,7 @@ class EconomyService:
         Returns:
             Income (positive) or cost (negative) in money units
         """
-        if planet.state not in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+        if planet.state not in OWNED_PLANET_STATES:
             return 0
 
         population = planet.population
@@ -204,7 +205,7 @@ class EconomyService:
         if planet.metal_remaining <= 0:
             return 0
 
-        if planet.state not in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+        if planet.state not in OWNED_PLANET_STATES:
             return 0
 
         # Use planet's mining budget percentage
@@ -404,7 +405,7 @@ class EconomyService:
         Returns:
             Population change (can be negative for harsh conditions)
         """
-        if planet.state not in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+        if planet.state not in OWNED_PLANET_STATES:
             return 0
 
         if planet.population <= 0:
@@ -470,7 +471,7 @@ class EconomyService:
         Returns:
             Temperature change (positive = warming, negative = cooling)
         """
-        if planet.state not in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+        if planet.state not in OWNED_PLANET_STATES:
             return 0.0
 
         # Already at ideal temperature
@@ -543,7 +544,7 @@ class EconomyService:
         }
 
         for planet in player.planets:
-            if planet.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+            if planet.state in OWNED_PLANET_STATES:
                 result = EconomyService.process_planet_terraformation(planet)
                 results["planets"][planet.id] = {
                     "name": planet.name,
@@ -569,7 +570,7 @@ class EconomyService:
         Returns:
             Dictionary with abandonment results
         """
-        if planet.state not in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+        if planet.state not in OWNED_PLANET_STATES:
             raise ValueError("Cannot abandon a planet that is not colonized")
 
         result = {
@@ -600,7 +601,7 @@ class EconomyService:
         # Update player's planet count
         if owner:
             owner.planet_count = len([p for p in owner.planets
-                                      if p.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]])
+                                      if p.state in OWNED_PLANET_STATES])
 
         return result
 
@@ -673,7 +674,7 @@ class EconomyService:
         Returns:
             Production points generated this turn
         """
-        if planet.state not in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+        if planet.state not in OWNED_PLANET_STATES:
             return 0.0
 
         # Use planet's ships budget percentage
@@ -724,10 +725,8 @@ class EconomyService:
         if production_points <= 0:
             return result
 
-        # Get queue items ordered by priority
-        queue_items = planet.production_queue.filter_by(is_completed=False).order_by(
-            ProductionQueue.priority
-        ).all()
+        # Get queue items (the relationship is already ordered by priority)
+        queue_items = [item for item in planet.production_queue if not item.is_completed]
 
         if not queue_items:
             # No ships to build, accumulate points on planet
@@ -845,7 +844,7 @@ class EconomyService:
         # Create the ship
         ship = Ship(
             design_id=design.id,
-            fleet_id=fleet.id,
+            fleet=fleet,
         )
         db.session.add(ship)
 
@@ -867,11 +866,19 @@ class EconomyService:
             "total_ships_completed": 0,
         }
 
-        for planet in player.planets:
-            if planet.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
-                result = EconomyService.process_planet_ship_production(planet)
-                results["planets"][planet.id] = result
-                results["total_ships_completed"] += len(result["ships_completed"])
+        planets = [planet for planet in player.planets if planet.state in OWNED_PLANET_STATES]
+
+        # Load the queues of all these planets in one query, pending items only:
+        # completed items are kept as history and grow every turn
+        if planets:
+            Planet.query.filter(Planet.id.in_([planet.id for planet in planets])).options(
+                selectinload(Planet.production_queue.and_(ProductionQueue.is_completed == False))  # noqa: E712
+            ).all()
+
+        for planet in planets:
+            result = EconomyService.process_planet_ship_production(planet)
+            results["planets"][planet.id] = result
+            results["total_ships_completed"] += len(result["ships_completed"])
 
         return results
 
@@ -894,17 +901,16 @@ class EconomyService:
         Returns:
             Tuple of (success, message, list of queue items)
         """
-        from app.models import ShipDesign
 
         # Verify planet is owned and colonized
         if not planet.owner:
             return False, "Planet has no owner", []
 
-        if planet.state not in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+        if planet.state not in OWNED_PLANET_STATES:
             return False, "Planet is not colonized", []
 
         # Verify design belongs to planet owner
-        design = ShipDesign.query.get(design_id)
+        design = db.session.get(ShipDesign, design_id)
         if not design:
             return False, "Design not found", []
 
@@ -913,7 +919,7 @@ class EconomyService:
 
         # Verify fleet if specified
         if fleet_id:
-            fleet = Fleet.query.get(fleet_id)
+            fleet = db.session.get(Fleet, fleet_id)
             if not fleet:
                 return False, "Fleet not found", []
             if fleet.player_id != planet.owner_id:
@@ -930,8 +936,9 @@ class EconomyService:
         # Add items to queue
         items = []
         for i in range(count):
+            # Set the relationship so an already loaded planet.production_queue sees it
             item = ProductionQueue(
-                planet_id=planet.id,
+                planet=planet,
                 design_id=design_id,
                 fleet_id=fleet_id,
                 priority=max_priority + i + 1,
@@ -954,7 +961,7 @@ class EconomyService:
         Returns:
             Tuple of (success, message)
         """
-        item = ProductionQueue.query.get(queue_id)
+        item = db.session.get(ProductionQueue, queue_id)
         if not item:
             return False, "Queue item not found"
 
@@ -6,20 +6,22 @@ import math
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
+
 from app import db
 from app.models import (
-    GamePlayer, Planet, PlanetState,
+    Game, GamePlayer, Planet, PlanetState,
     Ship, ShipDesign, Fleet,
     ShipType, FleetStatus, SHIP_BASE_STATS,
 )
+from app.utils.loading import loader_options
 
 
 # =============================================================================
 # Constants
 # =============================================================================
 
-DISBAND_METAL_RECOVERY = 0.75  # 75% metal recovered when disbanding
-TANKER_RANGE_BONUS = 1.5  # Tankers extend range by 50%
 BASE_FUEL_CAPACITY = 100.0  # Base fuel units (enough for long-range trips)
 PROTOTYPE_COST_MULTIPLIER = 2  # Prototype costs 2x production
 
@@ -98,7 +100,9 @@ class FleetService:
     @staticmethod
     def get_player_designs(player: GamePlayer) -> List[ShipDesign]:
         """Get all designs owned by a player."""
-        return player.ship_designs.all()
+        # Designs are serialized from their own columns; STRICT_LOADING makes
+        # sure to_dict() never starts lazy-loading relationships per design
+        return ShipDesign.query.filter_by(player_id=player.id).options(*loader_options()).all()
 
     @staticmethod
     def calculate_design_costs(
@@ -141,6 +145,16 @@ class FleetService:
             "production_metal": metal_cost,
         }
 
+    @staticmethod
+    def design_costs_cache_key(player: GamePlayer, design_id: int) -> str:
+        """
+        Cache key of a design's costs response (see get_design_costs route).
+
+        The key changes every turn: a prototype completed by turn production
+        is committed together with the new turn number.
+        """
+        return f"design:{player.id}:{player.game.current_turn}:{design_id}:costs"
+
     # -------------------------------------------------------------------------
     # Ship Construction
     # -------------------------------------------------------------------------
@@ -183,7 +197,7 @@ class FleetService:
         # Create ship
         ship = Ship(
             design_id=design.id,
-            fleet_id=fleet.id,
+            fleet=fleet,
         )
         db.session.add(ship)
 
@@ -230,7 +244,7 @@ class FleetService:
         # Create ship
         ship = Ship(
             design_id=design.id,
-            fleet_id=fleet.id,
+            fleet=fleet,
         )
         db.session.add(ship)
 
@@ -261,13 +275,43 @@ class FleetService:
             return False, "Count must be positive", []
 
         ships = []
-        for i in range(count):
-            success, message, ship = FleetService.build_ship(player, design, fleet)
+        if not design.is_prototype_built:
+            success, message, ship = FleetService.build_prototype(player, design, fleet)
             if not success:
-                if ships:
-                    return True, f"Built {len(ships)} ships, then: {message}", ships
                 return False, message, []
             ships.append(ship)
+            count -= 1
+
+        if design.player_id != player.id:
+            return False, "This design belongs to another player", []
+
+        # How many ships the player can pay for, and what runs out first
+        money_cost = design.production_cost_money
+        metal_cost = design.production_cost_metal
+        by_money = max(0, player.money // money_cost) if money_cost > 0 else count
+        by_metal = max(0, player.metal // metal_cost) if metal_cost > 0 else count
+        affordable = min(count, by_money, by_metal)
+
+        if affordable:
+            # One multi-row INSERT instead of one INSERT per ship
+            ships += db.session.scalars(
+                insert(Ship).returning(Ship),
+                [{"design_id": design.id, "fleet_id": fleet.id} for _ in range(affordable)],
+            ).all()
+            # The bulk insert bypasses the loaded fleet.ships collection
+            db.session.expire(fleet, ["ships"])
+            player.money -= money_cost * affordable
+            player.metal -= metal_cost * affordable
+            design.ships_built += affordable
+
+        if affordable < count:
+            if by_money <= by_metal:
+                message = f"Not enough money (need {money_cost})"
+            else:
+                message = f"Not enough metal (need {metal_cost})"
+            if ships:
+                return True, f"Built {len(ships)} ships, then: {message}", ships
+            return False, message, []
 
         return True, f"Built {len(ships)} ships", ships
 
@@ -314,7 +358,7 @@ class FleetService:
         if ship.fleet and ship.fleet.current_planet_id != fleet.current_planet_id:
             return False
 
-        ship.fleet_id = fleet.id
+        ship.fleet = fleet
         return True
 
     @staticmethod
@@ -323,7 +367,7 @@ class FleetService:
         if ship.fleet_id is None:
             return False
 
-        ship.fleet_id = None
+        ship.fleet = None
         return True
 
     @staticmethod
@@ -349,7 +393,7 @@ class FleetService:
         # Validate ships belong to this fleet
         ships_to_move = []
         for ship_id in ship_ids:
-            ship = Ship.query.get(ship_id)
+            ship = db.session.get(Ship, ship_id)
             if not ship or ship.fleet_id != fleet.id:
                 return False, f"Ship {ship_id} not in this fleet", None
             if ship.is_destroyed:
@@ -373,7 +417,7 @@ class FleetService:
 
         # Move ships
         for ship in ships_to_move:
-            ship.fleet_id = new_fleet.id
+            ship.fleet = new_fleet
 
         return True, f"Split {len(ships_to_move)} ships to new fleet", new_fleet
 
@@ -400,8 +444,8 @@ class FleetService:
 
         # Move all ships from fleet2 to fleet1
         ships_moved = 0
-        for ship in fleet2.ships.filter_by(is_destroyed=False).all():
-            ship.fleet_id = fleet1.id
+        for ship in fleet2.active_ships():
+            ship.fleet = fleet1
             ships_moved += 1
 
         # Flush to ensure ship changes are persisted before deleting fleet2
@@ -438,7 +482,7 @@ class FleetService:
         if fleet.current_planet_id == destination.id:
             return 0
 
-        current_planet = Planet.query.get(fleet.current_planet_id)
+        current_planet = db.session.get(Planet, fleet.current_planet_id)
         if not current_planet:
             return -1
 
@@ -468,7 +512,7 @@ class FleetService:
         if fleet.current_planet_id == destination.id:
             return False, "Already at destination"
 
-        current_planet = Planet.query.get(fleet.current_planet_id)
+        current_planet = db.session.get(Planet, fleet.current_planet_id)
         if not current_planet:
             return False, "Fleet has no current location"
 
@@ -481,7 +525,7 @@ class FleetService:
             return False, f"Not enough fuel (need: {distance:.1f}, have: {fleet.fuel_remaining:.1f})"
 
         # Check for satellites (cannot move)
-        for ship in fleet.ships.filter_by(is_destroyed=False):
+        for ship in fleet.active_ships():
             if ship.design.ship_type == ShipType.SATELLITE.value:
                 return False, "Fleet contains satellites which cannot move"
 
@@ -508,7 +552,7 @@ class FleetService:
         if not can_move:
             return False, reason
 
-        current_planet = Planet.query.get(fleet.current_planet_id)
+        current_planet = db.session.get(Planet, fleet.current_planet_id)
         distance = FleetService.calculate_distance(current_planet, destination)
         travel_time = FleetService.calculate_travel_time(fleet, destination)
 
@@ -538,9 +582,8 @@ class FleetService:
         Returns:
             Dictionary with movement results
         """
-        from app.models import Game
 
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             return {"error": "Game not found"}
 
@@ -573,7 +616,7 @@ class FleetService:
 
                     # Check for auto-colonization (AI players)
                     if player.is_ai and fleet.can_colonize:
-                        planet = Planet.query.get(destination_planet_id)
+                        planet = db.session.get(Planet, destination_planet_id)
                         if planet and planet.state not in [
                             PlanetState.COLONIZED.value,
                             PlanetState.DEVELOPED.value
@@ -632,7 +675,7 @@ class FleetService:
 
         # Check if at a planet where we can refuel
         if fleet.current_planet_id:
-            planet = Planet.query.get(fleet.current_planet_id)
+            planet = db.session.get(Planet, fleet.current_planet_id)
             if planet and FleetService.can_refuel_at(fleet, planet):
                 # Update max_fuel to current constant (in case it changed)
                 fleet.max_fuel = BASE_FUEL_CAPACITY
@@ -646,9 +689,8 @@ class FleetService:
         """
         Process automatic refueling for all fleets (called at end of turn).
         """
-        from app.models import Game
 
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             return {"error": "Game not found"}
 
@@ -698,16 +740,16 @@ class FleetService:
         # Must be at a friendly planet
         planet = None
         if fleet.current_planet_id:
-            planet = Planet.query.get(fleet.current_planet_id)
+            planet = db.session.get(Planet, fleet.current_planet_id)
 
         if not planet or planet.owner_id != fleet.player_id:
             return False, "Must be at a friendly planet to disband", 0
 
         # Calculate metal recovery
-        metal_recovered = int(ship.design.production_cost_metal * DISBAND_METAL_RECOVERY)
+        metal_recovered = ship.design.scrap_value
 
         # Give metal to player
-        player = GamePlayer.query.get(fleet.player_id)
+        player = db.session.get(GamePlayer, fleet.player_id)
         player.metal += metal_recovered
 
         # Destroy ship
@@ -733,7 +775,7 @@ class FleetService:
         total_metal = 0
         ships_disbanded = 0
 
-        for ship in fleet.ships.filter_by(is_destroyed=False):
+        for ship in fleet.active_ships():
             success, _, metal = FleetService.disband_ship(ship)
             if success:
                 total_metal += metal
@@ -769,7 +811,7 @@ class FleetService:
             status=FleetStatus.STATIONED.value,
             current_planet_id=planet.id
         ):
-            for ship in fleet.ships.filter_by(is_destroyed=False):
+            for ship in fleet.active_ships():
                 ship_type = ship.design.ship_type
                 ships_by_type[ship_type] = ships_by_type.get(ship_type, 0) + 1
 
@@ -855,11 +897,11 @@ class FleetService:
                 if fleet.id == new_fleet.id:
                     continue  # Skip the new fleet
 
-                for ship in fleet.ships.filter_by(is_destroyed=False):
+                for ship in fleet.active_ships():
                     if remaining <= 0:
                         break
                     if ship.design.ship_type == ship_type:
-                        ship.fleet_id = new_fleet.id
+                        ship.fleet = new_fleet
                         ships_moved += 1
                         remaining -= 1
 
@@ -889,22 +931,57 @@ class FleetService:
     # -------------------------------------------------------------------------
 
     @staticmethod
-    def get_player_fleet_summary(player: GamePlayer) -> Dict:
-        """Get summary of all fleets for a player."""
-        fleets = []
+    def fleet_summary_cache_key(player: GamePlayer) -> str:
+        """Cache key of a player's fleet summary for the current state."""
+        # Turn processing changes fleets too: the turn number covers it
+        return f"fleets:{player.id}:{player.game.current_turn}:{player.fleets_version}"
+
+    @staticmethod
+    def stationed_ships_cache_key(player: GamePlayer, planet_id: int) -> str:
+        """Cache key of the ships a player has stationed at a planet."""
+        return (
+            f"stationed:{player.id}:{planet_id}:"
+            f"{player.game.current_turn}:{player.fleets_version}"
+        )
+
+    @staticmethod
+    def bump_fleets_version(player: GamePlayer):
+        """Mark the player's fleets/designs as changed (new summary cache key)."""
+        player.fleets_version = GamePlayer.fleets_version + 1
+
+    @staticmethod
+    def get_player_fleet_summary(
+        player: GamePlayer,
+        fleets: Optional[List[Fleet]] = None,
+    ) -> Dict:
+        """
+        Get summary of all fleets for a player.
+
+        Args:
+            player: Player whose fleets are summarized
+            fleets: The player's fleets, already loaded with ships and designs
+                (loaded here the same way when omitted)
+        """
+        if fleets is None:
+            # Ships and their designs for all fleets in two batched queries
+            fleets = Fleet.query.filter_by(player_id=player.id).options(
+                *loader_options(selectinload(Fleet.ships).joinedload(Ship.design))
+            ).all()
+
+        fleet_dicts = []
         total_ships = 0
 
-        for fleet in player.fleets:
+        for fleet in fleets:
             fleet_data = fleet.to_dict()
-            fleets.append(fleet_data)
+            fleet_dicts.append(fleet_data)
             total_ships += fleet_data["ship_count"]
 
-        designs = [d.to_dict() for d in player.ship_designs]
+        designs = [d.to_dict() for d in FleetService.get_player_designs(player)]
 
         return {
             "player_id": player.id,
-            "total_fleets": len(fleets),
+            "total_fleets": len(fleet_dicts),
             "total_ships": total_ships,
-            "fleets": fleets,
+            "fleets": fleet_dicts,
             "designs": designs,
         }
@@ -454,5 +454,7 @@ def prepare_home_planet(planet: Planet) -> None:
     planet.population = 100_000
     planet.max_population = 1_000_000
     planet.is_home_planet = True
-    planet.terraform_budget = 30
-    planet.mining_budget = 70
+    # Already at ideal temperature: no terraforming needed
+    planet.terraform_budget = 0
+    planet.mining_budget = 67
+    planet.ships_budget = 33
@@ -3,12 +3,17 @@ Game management service.
 Handles game creation, player management, and game lifecycle.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 
 from app import db
-from app.models import Game, GamePlayer, GameStatus, AIDifficulty
+from app.models import Game, GamePlayer, GameStatus, AIDifficulty, User
 from app.data import get_random_ai_name, get_player_color, AI_NAMES
 from app.services.galaxy_generator import generate_galaxy, find_home_planets, prepare_home_planet
+from app.utils.cache import cache_counter, cache_incr
+from app.utils.errors import AuthorizationError, NotFoundError
 
 
 def _notify_lobby_update(game: Game):
@@ -21,6 +26,16 @@ def _notify_lobby_update(game: Game):
         print(f"[WS] Failed to emit lobby_update: {e}")
 
 
+def _lock_game(game_id: int) -> Optional[Game]:
+    """
+    Load a game with a row lock (SELECT ... FOR UPDATE) until commit.
+
+    Serializes concurrent changes to the same game (e.g. two joins racing
+    for the last slot) while other games proceed in parallel.
+    """
+    return db.session.get(Game, game_id, with_for_update=True, populate_existing=True)
+
+
 class GameService:
     """Service for managing games."""
 
@@ -28,6 +43,10 @@ class GameService:
     INITIAL_MONEY = 10000
     INITIAL_METAL = 500
 
+    # Lobby revision, bumped on every lobby change: list_games answers
+    # If-None-Match from it and caches one serialized list per revision
+    LOBBY_VERSION_KEY = "lobby:version"
+
     @staticmethod
     def create_game(
         creator_id: int,
@@ -57,13 +76,12 @@ class GameService:
         Returns:
             Created Game instance
         """
-        from app.models import User
 
         # Validate max_players
         max_players = max(2, min(8, max_players))
 
         # Get creator info
-        creator = User.query.get(creator_id)
+        creator = db.session.get(User, creator_id)
         if not creator:
             raise ValueError("Creator not found")
 
@@ -95,6 +113,7 @@ class GameService:
         )
         db.session.add(player)
         db.session.commit()
+        GameService.invalidate_lobby()
 
         return game
 
@@ -113,11 +132,10 @@ class GameService:
         Raises:
             ValueError: If game is full, started, or user already in game
         """
-        from app.models import User
 
-        game = Game.query.get(game_id)
+        game = _lock_game(game_id)
         if not game:
-            raise ValueError("Game not found")
+            raise NotFoundError("Game not found")
 
         if game.status != GameStatus.LOBBY.value:
             raise ValueError("Game has already started")
@@ -133,9 +151,9 @@ class GameService:
             raise ValueError("Already in this game")
 
         # Get user info
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
-            raise ValueError("User not found")
+            raise NotFoundError("User not found")
 
         # Create player
         player = GamePlayer(
@@ -149,6 +167,7 @@ class GameService:
         )
         db.session.add(player)
         db.session.commit()
+        GameService.invalidate_game(game_id)
 
         # Notify lobby via WebSocket
         _notify_lobby_update(game)
@@ -170,9 +189,9 @@ class GameService:
         Raises:
             ValueError: If game started or user is admin
         """
-        game = Game.query.get(game_id)
+        game = _lock_game(game_id)
         if not game:
-            raise ValueError("Game not found")
+            raise NotFoundError("Game not found")
 
         if game.status != GameStatus.LOBBY.value:
             raise ValueError("Cannot leave a started game")
@@ -187,6 +206,7 @@ class GameService:
 
         db.session.delete(player)
         db.session.commit()
+        GameService.invalidate_game(game_id)
 
         # Notify lobby via WebSocket
         _notify_lobby_update(game)
@@ -196,6 +216,7 @@ class GameService:
     @staticmethod
     def add_ai_player(
         game_id: int,
+        admin_user_id: int,
         difficulty: str = "medium",
         name: Optional[str] = None,
     ) -> GamePlayer:
@@ -204,25 +225,31 @@ class GameService:
 
         Args:
             game_id: ID of the game
+            admin_user_id: ID of the user adding the AI (must be admin)
             difficulty: AI difficulty level
             name: Optional custom name for the AI
 
         Returns:
             Created GamePlayer instance
         """
-        game = Game.query.get(game_id)
+        game = _lock_game(game_id)
         if not game:
-            raise ValueError("Game not found")
+            raise NotFoundError("Game not found")
+
+        if game.admin_user_id != admin_user_id:
+            raise AuthorizationError("Only game admin can add AI players")
 
         if game.status != GameStatus.LOBBY.value:
             raise ValueError("Game has already started")
 
-        current_players = game.players.count()
+        # One query for the slot check, the AI names and the color
+        players = game.players.all()
+        current_players = len(players)
         if current_players >= game.max_players:
             raise ValueError("Game is full")
 
         # Get used AI names
-        used_names = {p.player_name for p in game.players if p.is_ai}
+        used_names = {p.player_name for p in players if p.is_ai}
 
         # Generate or validate name
         if not name:
@@ -242,6 +269,7 @@ class GameService:
         )
         db.session.add(player)
         db.session.commit()
+        GameService.invalidate_game(game_id)
 
         # Notify lobby via WebSocket
         _notify_lobby_update(game)
@@ -249,27 +277,35 @@ class GameService:
         return player
 
     @staticmethod
-    def remove_ai_player(game_id: int, player_id: int) -> bool:
+    def remove_ai_player(game_id: int, player_id: int, admin_user_id: int) -> bool:
         """
         Remove an AI player from a game.
 
         Args:
             game_id: ID of the game
             player_id: ID of the AI player to remove
+            admin_user_id: ID of the user removing the AI (must be admin)
 
         Returns:
             True if successful
         """
+        game = _lock_game(game_id)
+        if not game:
+            raise NotFoundError("Game not found")
+
+        if game.admin_user_id != admin_user_id:
+            raise AuthorizationError("Only game admin can remove AI players")
+
         player = GamePlayer.query.filter_by(id=player_id, game_id=game_id, is_ai=True).first()
         if not player:
             raise ValueError("AI player not found")
 
-        game = Game.query.get(game_id)
         if game.status != GameStatus.LOBBY.value:
             raise ValueError("Cannot modify players in a started game")
 
         db.session.delete(player)
         db.session.commit()
+        GameService.invalidate_game(game_id)
 
         # Notify lobby via WebSocket
         _notify_lobby_update(game)
@@ -295,16 +331,17 @@ class GameService:
 
         player.is_ready = ready
         db.session.commit()
+        GameService.invalidate_game(game_id)
 
         # Notify lobby via WebSocket
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if game:
             _notify_lobby_update(game)
 
         return player
 
     @staticmethod
-    def start_game(game_id: int, admin_user_id: int) -> Game:
+    def start_game(game_id: int, admin_user_id: int) -> dict:
         """
         Start a game - generate galaxy and assign home planets.
 
@@ -313,27 +350,27 @@ class GameService:
             admin_user_id: ID of the user starting the game (must be admin)
 
         Returns:
-            Updated Game instance
+            Details of the started game (see game_details), also sent to
+            the players over WebSocket
         """
-        game = Game.query.get(game_id)
+        game = _lock_game(game_id)
         if not game:
-            raise ValueError("Game not found")
+            raise NotFoundError("Game not found")
 
         if game.admin_user_id != admin_user_id:
-            raise ValueError("Only the game admin can start the game")
+            raise AuthorizationError("Only the game admin can start the game")
 
         if game.status != GameStatus.LOBBY.value:
             raise ValueError("Game has already started")
 
-        # Check minimum players
-        player_count = game.players.count()
-        if player_count < 2:
+        # Check minimum players (one query for both checks)
+        players = game.players.all()
+        if len(players) < 2:
             raise ValueError("Need at least 2 players to start")
 
         # Check all human players are ready
-        human_players = game.players.filter_by(is_ai=False).all()
-        for player in human_players:
-            if not player.is_ready and player.user_id != admin_user_id:
+        for player in players:
+            if not player.is_ai and not player.is_ready and player.user_id != admin_user_id:
                 raise ValueError("Not all players are ready")
 
         # Determine galaxy size from star_count
@@ -353,8 +390,9 @@ class GameService:
             density=galaxy_density,
         )
 
-        # Find and assign home planets
-        players = list(game.players.all())
+        # Find and assign home planets (generate_galaxy committed: one query
+        # refreshes all the expired players)
+        players = game.players.all()
         home_planets = find_home_planets(galaxy, len(players))
 
         for player, planet in zip(players, home_planets):
@@ -372,17 +410,20 @@ class GameService:
         game.current_turn = 1
 
         db.session.commit()
+        GameService.invalidate_game(game_id)
+
+        # Serialized once for both the WebSocket event and the HTTP response
+        # (one query reloads all the players expired by the commit)
+        game_data = GameService.game_details(game, game.players.all())
 
         # Notify all players via WebSocket that game has started
         try:
             from app.websocket import emit_game_started
-            game_data = game.to_dict()
-            game_data["players"] = [p.to_dict() for p in game.players]
             emit_game_started(game.id, game_data)
         except Exception as e:
             print(f"[WS] Failed to emit game_started: {e}")
 
-        return game
+        return game_data
 
     @staticmethod
     def delete_game(game_id: int, admin_user_id: int) -> bool:
@@ -396,12 +437,12 @@ class GameService:
         Returns:
             True if successful
         """
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
-            raise ValueError("Game not found")
+            raise NotFoundError("Game not found")
 
         if game.admin_user_id != admin_user_id:
-            raise ValueError("Only the game admin can delete the game")
+            raise AuthorizationError("Only the game admin can delete the game")
 
         if game.status not in [GameStatus.LOBBY.value, GameStatus.ABANDONED.value]:
             raise ValueError("Cannot delete a game in progress")
@@ -416,6 +457,7 @@ class GameService:
         # Delete game
         db.session.delete(game)
         db.session.commit()
+        GameService.invalidate_game(game_id)
 
         return True
 
@@ -453,12 +495,12 @@ class GameService:
         Raises:
             ValueError: If game not found, user not admin, or game started
         """
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
-            raise ValueError("Game not found")
+            raise NotFoundError("Game not found")
 
         if game.admin_user_id != admin_user_id:
-            raise ValueError("Only the game admin can modify the game")
+            raise AuthorizationError("Only the game admin can modify the game")
 
         if game.status != GameStatus.LOBBY.value:
             raise ValueError("Cannot modify a game that has started")
@@ -494,12 +536,49 @@ class GameService:
             game.combat_luck_enabled = combat_luck_enabled
 
         db.session.commit()
+        GameService.invalidate_game(game_id)
 
         # Notify lobby via WebSocket
         _notify_lobby_update(game)
 
         return game
 
+    @staticmethod
+    def lobby_version() -> Optional[int]:
+        """Current lobby revision, or None when the cache is unavailable."""
+        return cache_counter(GameService.LOBBY_VERSION_KEY)
+
+    @staticmethod
+    def lobby_cache_key(version: int) -> str:
+        """Cache key of the serialized lobby list at a given revision."""
+        return f"lobby:games:v1:{version}"
+
+    @staticmethod
+    def invalidate_lobby():
+        """Bump the lobby revision after a lobby game was created or changed."""
+        cache_incr(GameService.LOBBY_VERSION_KEY)
+
+    @staticmethod
+    def game_version_key(game_id: int) -> str:
+        """Cache key of a game's details revision counter."""
+        return f"game:{game_id}:version"
+
+    @staticmethod
+    def game_version(game_id: int) -> Optional[int]:
+        """Current revision of a game's details, or None when the cache is unavailable."""
+        return cache_counter(GameService.game_version_key(game_id))
+
+    @staticmethod
+    def lobby_game_cache_key(game_id: int, version: int) -> str:
+        """Cache key of a lobby game's serialized details (game + players) at a given revision."""
+        return f"game:{game_id}:lobby_details:{version}"
+
+    @staticmethod
+    def invalidate_game(game_id: int):
+        """Bump the lobby revision and the game's details revision after a commit."""
+        GameService.invalidate_lobby()
+        cache_incr(GameService.game_version_key(game_id))
+
     @staticmethod
     def get_lobby_games() -> List[Game]:
         """Get all games in lobby status."""
@@ -508,4 +587,70 @@ class GameService:
     @staticmethod
     def get_game_details(game_id: int) -> Optional[Game]:
         """Get game with all details."""
-        return Game.query.get(game_id)
+        return db.session.get(Game, game_id, options=[joinedload(Game.galaxy)])
+
+    @staticmethod
+    def game_details(game: Game, players: List[GamePlayer]) -> dict:
+        """
+        Serialize a game with its players and galaxy summary.
+
+        Args:
+            game: The game
+            players: Its players, already loaded (also gives the count)
+
+        Returns:
+            Game dict with "players" and, once started, "galaxy"
+        """
+        data = game.to_dict(player_count=len(players))
+        data["players"] = [player.to_dict() for player in players]
+
+        # Include galaxy info if game has started
+        if game.galaxy:
+            data["galaxy"] = game.galaxy.to_dict()
+        return data
+
+    @staticmethod
+    def get_games_bulk(game_ids: Iterable[int]) -> List[Tuple[Game, List[GamePlayer]]]:
+        """
+        Get several games with their galaxy and players in two queries.
+
+        Args:
+            game_ids: IDs of the games (unknown ids are skipped)
+
+        Returns:
+            (game, players) pairs, in game id order
+        """
+        game_ids = list(game_ids)
+        if not game_ids:
+            return []
+        games = Game.query.options(joinedload(Game.galaxy)).filter(
+            Game.id.in_(game_ids)
+        ).order_by(Game.id).all()
+
+        players_by_game = {game.id: [] for game in games}
+        players = GamePlayer.query.filter(
+            GamePlayer.game_id.in_(players_by_game)
+        ).order_by(GamePlayer.id).all()
+        for player in players:
+            players_by_game[player.game_id].append(player)
+
+        return [(game, players_by_game[game.id]) for game in games]
+
+    @staticmethod
+    def count_players(game_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        Count the players of several games in one query.
+
+        Args:
+            game_ids: IDs of the games
+
+        Returns:
+            Player count by game id (games without players are absent)
+        """
+        game_ids = list(game_ids)
+        if not game_ids:
+            return {}
+        rows = db.session.query(
+            GamePlayer.game_id, func.count(GamePlayer.id)
+        ).filter(GamePlayer.game_id.in_(game_ids)).group_by(GamePlayer.game_id)
+        return dict(rows.all())
@@ -6,13 +6,17 @@ import math
 import random
 from typing import Dict, List, Optional, Tuple, Any
 
+from sqlalchemy.orm import joinedload
+
 from app import db
 from app.models import GamePlayer, Game
+from app.models.fleet import ShipType
 from app.models.technology import (
     PlayerTechnology, RadicalBreakthrough,
     TechDomain, RadicalBreakthroughType,
 )
 from app.services.economy import diminishing_returns
+from app.utils.cache import cache_counter, cache_incr
 
 
 # =============================================================================
@@ -106,7 +110,7 @@ class TechnologyService:
         shields_budget: int,
         mini_budget: int,
         radical_budget: int,
-    ) -> Tuple[bool, str]:
+    ) -> Tuple[bool, str, Optional[Dict[str, int]]]:
         """
         Update research budget allocation.
         All values must be 0-100 and sum to 100.
@@ -121,11 +125,11 @@ class TechnologyService:
             radical_budget: Allocation for Radical research (0-100)
 
         Returns:
-            Tuple of (success, message)
+            Tuple of (success, message, budget_dict)
         """
         total = range_budget + speed_budget + weapons_budget + shields_budget + mini_budget + radical_budget
         if total != 100:
-            return False, f"Budget must sum to 100 (got {total})"
+            return False, f"Budget must sum to 100 (got {total})", None
 
         for name, val in [
             ("range", range_budget),
@@ -136,7 +140,7 @@ class TechnologyService:
             ("radical", radical_budget),
         ]:
             if val < 0 or val > 100:
-                return False, f"Budget value for {name} must be 0-100 (got {val})"
+                return False, f"Budget value for {name} must be 0-100 (got {val})", None
 
         tech = TechnologyService.get_or_create_technology(player)
 
@@ -147,7 +151,7 @@ class TechnologyService:
         tech.mini_budget = mini_budget
         tech.radical_budget = radical_budget
 
-        return True, "Research budget updated"
+        return True, "Research budget updated", tech.to_dict()["budget"]
 
     # -------------------------------------------------------------------------
     # Research Calculations
@@ -370,7 +374,7 @@ class TechnologyService:
         Returns:
             Tuple of (success, message, result_dict)
         """
-        breakthrough = RadicalBreakthrough.query.get(breakthrough_id)
+        breakthrough = db.session.get(RadicalBreakthrough, breakthrough_id)
         if not breakthrough:
             return False, "Breakthrough not found", None
 
@@ -472,6 +476,41 @@ class TechnologyService:
 
         return effect
 
+    # -------------------------------------------------------------------------
+    # Caching
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def tech_version_key(game_id: int) -> str:
+        """Cache key of a game's technology revision counter."""
+        return f"tech:game:{game_id}:version"
+
+    @staticmethod
+    def tech_version(game_id: int) -> Optional[int]:
+        """Current technology revision of a game, or None when the cache is unavailable."""
+        return cache_counter(TechnologyService.tech_version_key(game_id))
+
+    @staticmethod
+    def invalidate_game_tech(game_id: int):
+        """
+        Bump a game's technology revision after a commit.
+
+        Levels change at turn end, which the cache keys already follow. Within
+        a turn, a breakthrough adds temporary bonuses and a lazily created
+        record adds an opponent to the comparison: their routes call this.
+        """
+        cache_incr(TechnologyService.tech_version_key(game_id))
+
+    @staticmethod
+    def max_levels_cache_key(player: GamePlayer, version: int) -> str:
+        """Cache key of a player's max tech levels for the current turn and revision."""
+        return f"tech:{player.id}:{player.game.current_turn}:{version}:max_levels"
+
+    @staticmethod
+    def comparison_cache_key(player: GamePlayer, version: int) -> str:
+        """Cache key of a player's technology comparison for the current turn and revision."""
+        return f"tech:{player.id}:{player.game.current_turn}:{version}:comparison"
+
     # -------------------------------------------------------------------------
     # Technology Comparison (US 5.8)
     # -------------------------------------------------------------------------
@@ -489,6 +528,9 @@ class TechnologyService:
         Returns:
             Dict with player's levels and relative position to opponents
         """
+        # All players with their technology in one query (this also fills
+        # player.technology below)
+        players = game.players.options(joinedload(GamePlayer.technology)).all()
         player_tech = TechnologyService.get_or_create_technology(player)
 
         comparison: Dict[str, Any] = {
@@ -496,7 +538,7 @@ class TechnologyService:
             "opponents": [],
         }
 
-        for opponent in game.players:
+        for opponent in players:
             if opponent.id == player.id:
                 continue
             if opponent.is_eliminated:
@@ -545,7 +587,6 @@ class TechnologyService:
         Returns:
             Tuple of (can_build, reason)
         """
-        from app.models.fleet import ShipType
 
         tech = player.technology
         if not tech:
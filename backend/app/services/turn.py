@@ -6,7 +6,8 @@ from datetime import datetime
 from typing import Dict, List, Any
 
 from app import db
-from app.models import Game, GamePlayer, Planet, GameStatus, PlanetState
+from app.models import Game, GamePlayer, Planet, GameStatus, PlanetState, OWNED_PLANET_STATES
+from app.models.combat import CombatReport
 from app.services.economy import EconomyService
 from app.services.technology import TechnologyService
 from app.services.fleet import FleetService
@@ -154,7 +155,7 @@ class TurnService:
 
         # 3. Process mining on all planets
         for planet in player.planets:
-            if planet.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+            if planet.state in OWNED_PLANET_STATES:
                 metal_extracted = EconomyService.process_planet_mining(planet)
                 result["mining"]["planets"][planet.id] = {
                     "name": planet.name,
@@ -177,7 +178,7 @@ class TurnService:
 
         # 6. Process population growth on all planets
         for planet in player.planets:
-            if planet.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]:
+            if planet.state in OWNED_PLANET_STATES:
                 growth = EconomyService.process_population_growth(planet)
                 result["population_growth"]["planets"][planet.id] = {
                     "name": planet.name,
@@ -193,7 +194,7 @@ class TurnService:
 
         # Update planet count
         player.planet_count = len([p for p in player.planets
-                                   if p.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]])
+                                   if p.state in OWNED_PLANET_STATES])
 
         # Record final state
         result["after"] = {
@@ -231,7 +232,7 @@ class TurnService:
 
         # Check no planets
         owned_planets = [p for p in player.planets
-                        if p.state in [PlanetState.COLONIZED.value, PlanetState.DEVELOPED.value]]
+                        if p.state in OWNED_PLANET_STATES]
         if len(owned_planets) == 0:
             TurnService._eliminate_player(player, "no_planets")
             return True
@@ -261,6 +262,9 @@ class TurnService:
         """
         Mark a player as having submitted their turn.
 
+        Only flushes: the caller commits, together with the turn processing
+        when this submission completes the turn.
+
         Args:
             game_id: Game ID
             player_id: Player ID
@@ -278,7 +282,7 @@ class TurnService:
             raise ValueError("Player not found or eliminated")
 
         player.turn_submitted = True
-        db.session.commit()
+        db.session.flush()
 
         # Check if all players have submitted
         return TurnService.all_players_submitted(game_id)
@@ -294,7 +298,7 @@ class TurnService:
         Returns:
             True if all players have submitted
         """
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             return False
 
@@ -320,7 +324,7 @@ class TurnService:
         Returns:
             Dictionary with turn status info
         """
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             raise ValueError("Game not found")
 
@@ -352,7 +356,6 @@ class TurnService:
         Returns:
             List of CombatReport instances
         """
-        from app.models.combat import CombatReport
 
         combat_reports = []
 
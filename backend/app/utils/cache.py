@@ -0,0 +1,139 @@
+"""
+Optional Redis cache
+
+Enabled when REDIS_URL is configured and the redis package is installed;
+otherwise every lookup is a miss and writes are ignored, so callers never
+need to check whether the cache is available. Redis errors are logged and
+treated the same way: the cache must never break a request.
+"""
+from typing import Callable, Optional
+
+from flask import current_app
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is optional
+    redis = None
+
+
+def init_cache(app):
+    """Create the Redis client for the app (None when disabled)."""
+    url = app.config.get("REDIS_URL")
+    client = None
+    if url:
+        if redis is None:
+            app.logger.warning("REDIS_URL is set but the redis package is not installed")
+        else:
+            client = redis.Redis.from_url(url, socket_timeout=0.5)
+    app.extensions["redis"] = client
+
+
+def get_redis():
+    """Redis client of the current app, or None when caching is disabled."""
+    return current_app.extensions.get("redis")
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    """Return the cached value for key, or None on miss."""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return client.get(key)
+    except redis.RedisError as e:
+        current_app.logger.warning(f"[Cache] GET {key} failed: {e}")
+        return None
+
+
+def cache_set(key: str, value: bytes, ttl: int):
+    """Store value under key for ttl seconds."""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, value)
+    except redis.RedisError as e:
+        current_app.logger.warning(f"[Cache] SET {key} failed: {e}")
+
+
+def cache_delete(*keys: str):
+    """Remove keys from the cache."""
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        current_app.logger.warning(f"[Cache] DELETE failed: {e}")
+
+
+def cache_counter(key: str) -> Optional[int]:
+    """
+    Return the integer counter stored under key (0 if never incremented).
+
+    None means the cache is disabled or unreachable, so callers can tell a
+    known revision from an unknown one.
+    """
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return int(client.get(key) or 0)
+    except redis.RedisError as e:
+        current_app.logger.warning(f"[Cache] GET {key} failed: {e}")
+        return None
+
+
+def cache_incr(key: str):
+    """Increment the counter stored under key."""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.incr(key)
+    except redis.RedisError as e:
+        current_app.logger.warning(f"[Cache] INCR {key} failed: {e}")
+
+
+def cache_get_or_set_swr(key: str, factory: Callable[[], bytes], ttl: int, stale_ttl: int) -> bytes:
+    """
+    Stale-while-revalidate lookup.
+
+    A value is fresh for ttl seconds, then served stale for up to stale_ttl
+    more seconds while a single caller (holding a short Redis lock)
+    recomputes it, so a burst of requests on an expired key costs one
+    factory() call instead of one each.
+
+    Args:
+        key: Cache key (companion keys "<key>:fresh" and "<key>:lock" are used)
+        factory: Builds the value (bytes) on miss or refresh
+        ttl: Seconds the value is fresh
+        stale_ttl: Extra seconds a stale value may still be served
+
+    Returns:
+        The cached or freshly built value
+    """
+    client = get_redis()
+    if client is None:
+        return factory()
+
+    fresh_key, lock_key = f"{key}:fresh", f"{key}:lock"
+    try:
+        value, fresh = client.mget(key, fresh_key)
+        if value is not None and (fresh or not client.set(lock_key, b"1", nx=True, ex=stale_ttl)):
+            # Fresh, or stale while another request is refreshing it
+            return value
+    except redis.RedisError as e:
+        current_app.logger.warning(f"[Cache] SWR GET {key} failed: {e}")
+        return factory()
+
+    value = factory()
+    try:
+        pipe = client.pipeline()
+        pipe.setex(key, ttl + stale_ttl, value)
+        pipe.setex(fresh_key, ttl, b"1")
+        pipe.delete(lock_key)
+        pipe.execute()
+    except redis.RedisError as e:
+        current_app.logger.warning(f"[Cache] SWR SET {key} failed: {e}")
+    return value
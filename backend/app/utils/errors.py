@@ -2,6 +2,7 @@
 Global error handlers
 """
 from flask import jsonify
+from pydantic import ValidationError as PydanticValidationError
 
 
 class APIError(Exception):
@@ -55,6 +56,20 @@ class RateLimitError(APIError):
         super().__init__(message, 429)
 
 
+def validation_error_response(error: PydanticValidationError, message: str = None):
+    """
+    400 response for a request body rejected by a pydantic schema.
+
+    "error" is a readable message (the first problem unless message is
+    given), "details" lists every problem as {loc, msg, type}.
+    """
+    details = [
+        {"loc": list(err["loc"]), "msg": err["msg"], "type": err["type"]}
+        for err in error.errors(include_url=False)
+    ]
+    return jsonify({"error": message or details[0]["msg"], "details": details}), 400
+
+
 def register_error_handlers(app):
     """Register error handlers on Flask app."""
 
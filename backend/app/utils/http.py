@@ -0,0 +1,55 @@
+"""
+HTTP caching helpers
+"""
+import hashlib
+from functools import wraps
+
+from flask import make_response, request
+
+
+def revision_etag(*parts) -> str:
+    """
+    Build an opaque ETag from a resource revision (ids, turn, version...).
+
+    Unlike ``etagged``, the tag is known before the response is built, so
+    an unchanged resource is answered without querying or serializing it.
+    """
+    key = ":".join(str(part) for part in parts)
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def tag_response(response, etag: str):
+    """Set the ETag and per-user revalidation headers on a response."""
+    response.set_etag(etag)
+    # Per-user data: only the client may store it, and must revalidate
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def not_modified(etag: str):
+    """Return an empty 304 if the client already holds ``etag``, else None."""
+    if etag in request.if_none_match:
+        return tag_response(make_response("", 304), etag)
+    return None
+
+
+def etagged(f):
+    """
+    Add an ETag to successful responses and answer If-None-Match.
+
+    The tag is a hash of the response body, so a client polling an
+    unchanged resource gets an empty 304 Not Modified instead of the
+    payload.
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        response = make_response(f(*args, **kwargs))
+
+        if response.status_code == 200 and not response.is_streamed:
+            tag_response(response, hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+            response.make_conditional(request)
+
+        return response
+
+    return decorated
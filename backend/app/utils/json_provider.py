@@ -0,0 +1,57 @@
+"""
+orjson-backed JSON provider
+
+Drop-in replacement for Flask's DefaultJSONProvider: jsonify() output keeps
+the same shape (HTTP dates, indentation in debug, keys sorted when
+sort_keys is set) but is encoded by orjson in C instead of the pure-Python
+json module.
+
+ORJSONCodec does the same for Socket.IO packets.
+"""
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils.json_stream import ORJSON_OPTIONS
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider using orjson for encoding and decoding."""
+
+    # Dates go through DefaultJSONProvider.default (HTTP date format), like before
+    base_option = ORJSON_OPTIONS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    @property
+    def option(self) -> int:
+        if self.sort_keys:
+            return self.base_option | orjson.OPT_SORT_KEYS
+        return self.base_option
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.option
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option) + b"\n",
+            mimetype=self.mimetype,
+        )
+
+
+class ORJSONCodec:
+    """json-module-like codec for Socket.IO (python-socketio's json option)."""
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        # kwargs (separators=...) only matter to the stdlib encoder: orjson
+        # output is always compact
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
@@ -0,0 +1,29 @@
+"""
+Pre-serialized JSON responses
+
+For hot read endpoints whose payload is plain data (no dates or other
+values needing the provider's default hook), orjson.dumps the dict once
+and wrap the bytes, skipping jsonify's provider dispatch.
+"""
+from typing import Any
+
+import orjson
+from flask import Response
+
+from app.utils.json_stream import ORJSON_OPTIONS
+
+
+def make_json_response(data: Any, status: int = 200) -> Response:
+    """
+    Build an application/json response from data or already-encoded bytes.
+
+    Args:
+        data: JSON-serializable value, or the bytes of a JSON document
+        status: HTTP status code
+
+    Returns:
+        Flask Response with the serialized body
+    """
+    if not isinstance(data, bytes):
+        data = orjson.dumps(data, option=ORJSON_OPTIONS)
+    return Response(data, status=status, mimetype="application/json")
@@ -0,0 +1,98 @@
+"""
+Streaming JSON responses
+
+Large payloads (turn results in particular) are serialized piece by piece
+with orjson and sent as they are produced, instead of building the whole
+JSON document in memory before handing it to jsonify.
+"""
+from types import GeneratorType
+from typing import Any, Iterator
+
+import orjson
+from flask import Response, stream_with_context
+
+# Turn results are keyed by player id (int), which orjson rejects by default
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Fragments are sent in chunks of about this size (one socket write each)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_json(obj: Any, depth: int = 2) -> Iterator[bytes]:
+    """
+    Serialize obj to JSON as a sequence of byte fragments.
+
+    Dicts and lists are opened and closed by hand down to `depth` levels,
+    each member being serialized separately; anything deeper is dumped in
+    one go. A generator is streamed as a list, its items being built only
+    as they are sent.
+
+    Args:
+        obj: JSON-serializable value
+        depth: Number of container levels to split into fragments
+
+    Yields:
+        Fragments which, concatenated, form a valid JSON document
+    """
+    if depth <= 0 or not isinstance(obj, (dict, list, GeneratorType)):
+        if isinstance(obj, GeneratorType):
+            obj = list(obj)
+        yield orjson.dumps(obj, option=ORJSON_OPTIONS)
+        return
+
+    if isinstance(obj, dict):
+        yield b"{"
+        for i, (key, value) in enumerate(obj.items()):
+            yield (b"," if i else b"") + orjson.dumps(str(key)) + b":"
+            yield from iter_json(value, depth - 1)
+        yield b"}"
+    else:
+        yield b"["
+        for i, value in enumerate(obj):
+            if i:
+                yield b","
+            yield from iter_json(value, depth - 1)
+        yield b"]"
+
+
+def iter_chunks(fragments: Iterator[bytes], size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Join small fragments into chunks of at least `size` bytes (except the last).
+
+    Args:
+        fragments: Byte fragments, e.g. from iter_json
+        size: Minimum chunk size
+
+    Yields:
+        Chunks which, concatenated, equal the concatenated fragments
+    """
+    buffer = []
+    buffered = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        buffered += len(fragment)
+        if buffered >= size:
+            yield b"".join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def stream_json(obj: Any, status: int = 200, depth: int = 2) -> Response:
+    """
+    Build a streamed application/json response for obj.
+
+    Args:
+        obj: JSON-serializable value
+        status: HTTP status code
+        depth: Number of container levels to split into fragments
+
+    Returns:
+        Flask Response streaming the serialized document
+    """
+    return Response(
+        stream_with_context(iter_chunks(iter_json(obj, depth))),
+        status=status,
+        mimetype="application/json",
+    )
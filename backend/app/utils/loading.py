@@ -0,0 +1,51 @@
+"""
+ORM loading helpers
+
+With STRICT_LOADING enabled (development and tests), the queries built with
+loader_options() refuse any relationship that was not eagerly loaded, so a
+forgotten selectinload/joinedload shows up as an error instead of a silent
+N+1. Many-to-one lookups answered from the identity map (e.g. ship.fleet on
+a ship loaded through fleet.ships) emit no SQL and are still allowed.
+"""
+from typing import Iterable
+
+from flask import current_app
+from sqlalchemy.orm import raiseload
+
+
+def loader_options(*options) -> list:
+    """
+    Build the loader options of a route query.
+
+    Args:
+        *options: Eager loads the caller relies on (selectinload, joinedload...)
+
+    Returns:
+        The given options, plus raiseload("*") when STRICT_LOADING is set
+    """
+    if current_app.config.get("STRICT_LOADING"):
+        return [*options, raiseload("*", sql_only=True)]
+    return list(options)
+
+
+def column_dict(instance, names: Iterable[str]) -> dict:
+    """
+    Read loaded column values straight from an instance's __dict__.
+
+    Serializers call this for their plain columns: a loaded value lives in
+    the instance dict, so reading it there skips one instrumented attribute
+    lookup per column. Expired or not yet flushed instances miss some keys
+    and fall back to normal attribute access (which loads them).
+
+    Args:
+        instance: Mapped instance
+        names: Column attribute names, in output order
+
+    Returns:
+        {name: value} for each name
+    """
+    values = instance.__dict__
+    try:
+        return {name: values[name] for name in names}
+    except KeyError:
+        return {name: getattr(instance, name) for name in names}
@@ -0,0 +1,27 @@
+"""
+Queued application logging
+
+Puts app.logger's handlers behind a QueueHandler: request threads only
+enqueue the record, and a QueueListener thread does the stream/file I/O.
+"""
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from flask.logging import default_handler
+
+
+def init_log_queue(app):
+    """Route app.logger through a queue drained by a background listener."""
+    logger = app.logger
+    handlers = logger.handlers[:] or [default_handler]
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener.start()
+    atexit.register(listener.stop)
+    app.extensions["log_listener"] = listener
@@ -0,0 +1,42 @@
+"""
+Read replica routing
+
+When a "read_replica" bind is configured (DATABASE_READ_URL), read-only
+routes can run their queries inside read_replica() to send the SELECTs to
+the replica. Flushes always go to the primary, and without a replica bind
+everything stays on the primary.
+"""
+from contextlib import contextmanager
+
+from flask import current_app
+from flask_sqlalchemy.session import Session
+
+READ_REPLICA_BIND = "read_replica"
+
+
+class RoutingSession(Session):
+    """db.session class sending reads to the replica inside read_replica()."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.info.get(READ_REPLICA_BIND) and not self._flushing:
+            engine = self._db.engines.get(READ_REPLICA_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def has_read_replica() -> bool:
+    """Whether a replica bind is configured for the current app."""
+    return READ_REPLICA_BIND in current_app.extensions["sqlalchemy"].engines
+
+
+@contextmanager
+def read_replica():
+    """Route the queries of the block to the read replica, if any."""
+    session = current_app.extensions["sqlalchemy"].session()
+    previous = session.info.get(READ_REPLICA_BIND, False)
+    session.info[READ_REPLICA_BIND] = True
+    try:
+        yield
+    finally:
+        session.info[READ_REPLICA_BIND] = previous
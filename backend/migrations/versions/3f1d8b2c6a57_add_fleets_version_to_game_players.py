@@ -0,0 +1,28 @@
+"""Add fleets_version to game_players
+
+Revision ID: 3f1d8b2c6a57
+Revises: a7c3e91f4b20
+Create Date: 2026-10-17 14:03:27.581944
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f1d8b2c6a57"
+down_revision = "a7c3e91f4b20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("game_players", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("fleets_version", sa.Integer(), nullable=False, server_default="0")
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("game_players", schema=None) as batch_op:
+        batch_op.drop_column("fleets_version")
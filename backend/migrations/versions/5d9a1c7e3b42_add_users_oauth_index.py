@@ -0,0 +1,26 @@
+"""Add index for OAuth user lookups
+
+Revision ID: 5d9a1c7e3b42
+Revises: 8b2e4f0d9c13
+Create Date: 2026-10-17 18:05:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5d9a1c7e3b42"
+down_revision = "8b2e4f0d9c13"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.create_index("ix_users_oauth_provider_id", ["oauth_provider", "oauth_id"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.drop_index("ix_users_oauth_provider_id")
@@ -0,0 +1,42 @@
+"""Add indexes for player, fleet and ship lookups
+
+Revision ID: 8b2e4f0d9c13
+Revises: 3f1d8b2c6a57
+Create Date: 2026-10-17 16:42:10.218365
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8b2e4f0d9c13"
+down_revision = "3f1d8b2c6a57"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("game_players", schema=None) as batch_op:
+        batch_op.create_index("ix_game_players_user_game", ["user_id", "game_id"], unique=False)
+
+    with op.batch_alter_table("fleets", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_fleets_player_planet_status",
+            ["player_id", "current_planet_id", "status"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("ships", schema=None) as batch_op:
+        batch_op.create_index("ix_ships_fleet_destroyed", ["fleet_id", "is_destroyed"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("ships", schema=None) as batch_op:
+        batch_op.drop_index("ix_ships_fleet_destroyed")
+
+    with op.batch_alter_table("fleets", schema=None) as batch_op:
+        batch_op.drop_index("ix_fleets_player_planet_status")
+
+    with op.batch_alter_table("game_players", schema=None) as batch_op:
+        batch_op.drop_index("ix_game_players_user_game")
@@ -0,0 +1,40 @@
+"""Add CHECK constraint on planet budget allocation
+
+Revision ID: a7c3e91f4b20
+Revises: e339cf9dadf4
+Create Date: 2026-10-17 09:12:41.203518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a7c3e91f4b20"
+down_revision = "e339cf9dadf4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Home planets were created with 30/70 and the default ships budget (133%).
+    # Bring them in line before enforcing the invariant.
+    op.execute(
+        "UPDATE planets SET terraform_budget = 0, mining_budget = 67, ships_budget = 33 "
+        "WHERE is_home_planet AND terraform_budget + mining_budget + ships_budget != 100"
+    )
+    op.execute(
+        "UPDATE planets SET terraform_budget = 34, mining_budget = 33, ships_budget = 33 "
+        "WHERE terraform_budget + mining_budget + ships_budget != 100"
+    )
+
+    with op.batch_alter_table("planets", schema=None) as batch_op:
+        batch_op.create_check_constraint(
+            "ck_planet_budget_sum",
+            "terraform_budget + mining_budget + ships_budget = 100",
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("planets", schema=None) as batch_op:
+        batch_op.drop_constraint("ck_planet_budget_sum", type_="check")
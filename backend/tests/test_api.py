@@ -27,3 +27,37 @@ def test_auth_status(client):
     assert response.status_code == 200
     data = response.get_json()
     assert data["module"] == "auth"
+
+
+def test_register_invalid_json(client):
+    """Test that a malformed body is rejected with validation details."""
+    response = client.post("/api/auth/register", data="{", content_type="application/json")
+    assert response.status_code == 400
+    data = response.get_json()
+    assert data["error"] == "Validation error"
+    assert data["details"][0]["type"] == "json_invalid"
+
+
+def auth_token(client) -> str:
+    """Register and log in a user; return its access token."""
+    credentials = {"email": "bearer@test.com", "password": "Password123!"}
+    client.post("/api/auth/register", json={**credentials, "pseudo": "Bearer"})
+    return client.post("/api/auth/login", json=credentials).get_json()["access_token"]
+
+
+def test_bearer_header_tolerates_extra_spaces(client):
+    """Both auth decorators accept several spaces around the token."""
+    token = auth_token(client)
+    for url in ("/api/users/me", "/api/games/my"):
+        response = client.get(url, headers={"Authorization": f"Bearer   {token} "})
+        assert response.status_code == 200, url
+
+
+def test_bearer_header_rejects_malformed_values(client):
+    """A missing token, a non-space separator or a second word is a format error."""
+    token = auth_token(client)
+    for value in ("Bearer", "Bearer  ", f"Bearer\t{token}", f"Bearer {token} extra", f"Basic {token}"):
+        for url in ("/api/users/me", "/api/games/my"):
+            response = client.get(url, headers={"Authorization": value})
+            assert response.status_code == 401, (url, value)
+            assert "Format" in response.get_json()["error"], (url, value)
@@ -265,6 +265,7 @@ class TestMining:
                 max_population=1000000,
                 mining_budget=50,
                 terraform_budget=50,
+                ships_budget=0,
                 owner_id=player.id,
             )
             db.session.add(planet)
@@ -587,6 +588,7 @@ class TestEconomySummary:
                     owner_id=player.id,
                     mining_budget=50,
                     terraform_budget=50,
+                    ships_budget=0,
                 )
                 db.session.add(planet)
 
@@ -670,6 +672,7 @@ class TestTerraformation:
                 max_population=500000,
                 terraform_budget=50,
                 mining_budget=50,
+                ships_budget=0,
                 owner_id=player.id,
             )
             db.session.add(planet)
@@ -804,6 +807,7 @@ class TestPlanetAbandonment:
                 max_population=1000000,
                 terraform_budget=50,
                 mining_budget=50,
+                ships_budget=0,
                 owner_id=player.id,
             )
             db.session.add(planet)
@@ -5,9 +5,9 @@ import pytest
 from app import db
 from app.models import (
     User, Game, GamePlayer, Galaxy, Star, Planet, PlanetState,
-    Ship, ShipDesign, Fleet, ShipType, FleetStatus,
+    Ship, ShipDesign, Fleet, ShipType, FleetStatus, DISBAND_METAL_RECOVERY,
 )
-from app.services.fleet import FleetService, DISBAND_METAL_RECOVERY
+from app.services.fleet import FleetService
 from app.services.auth import hash_password
 
 
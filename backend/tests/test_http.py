@@ -0,0 +1,72 @@
+"""
+HTTP caching helper tests
+"""
+from flask import jsonify
+
+from app.utils.http import etagged, not_modified, revision_etag, tag_response
+
+
+def test_etagged_returns_304_when_unchanged(app):
+    """A matching If-None-Match gets an empty 304."""
+    @etagged
+    def view():
+        return jsonify({"value": 1})
+
+    app.add_url_rule("/_test/etag", "test_etag", view)
+    client = app.test_client()
+
+    response = client.get("/_test/etag")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert "no-cache" in response.headers["Cache-Control"]
+
+    response = client.get("/_test/etag", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+
+
+def test_etagged_skips_errors(app):
+    """Error responses are not tagged."""
+    @etagged
+    def view():
+        return jsonify({"error": "nope"}), 404
+
+    app.add_url_rule("/_test/etag-error", "test_etag_error", view)
+    response = app.test_client().get("/_test/etag-error")
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
+
+
+def test_revision_etag_answers_before_building(app):
+    """A revision ETag short-circuits the view body when it matches."""
+    calls = []
+    revision = [3]
+
+    def view():
+        etag = revision_etag("fleets", 1, revision[0])
+        unchanged = not_modified(etag)
+        if unchanged:
+            return unchanged
+        calls.append(1)
+        return tag_response(jsonify({"value": 1}), etag)
+
+    app.add_url_rule("/_test/revision", "test_revision", view)
+    client = app.test_client()
+
+    response = client.get("/_test/revision")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag == f'"{revision_etag("fleets", 1, 3)}"'
+
+    response = client.get("/_test/revision", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert calls == [1]
+
+    # A new revision invalidates the tag the client holds
+    revision[0] = 4
+    response = client.get("/_test/revision", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == f'"{revision_etag("fleets", 1, 4)}"'
+    assert response.headers["ETag"] != etag
+    assert calls == [1, 1]
@@ -0,0 +1,96 @@
+"""
+JSON serialization tests
+"""
+import json
+from datetime import datetime
+
+from flask import request
+
+from app.utils.json_provider import ORJSONCodec
+from app.utils.json_response import make_json_response
+from app.utils.json_stream import iter_chunks, iter_json
+
+
+def test_iter_json_matches_json_dumps():
+    """Concatenated fragments form the same document as a one-shot dump."""
+    payload = {
+        "turn_processed": True,
+        "turn_results": {
+            "players": {1: {"income": 10}, 2: {"income": 5}},
+            "combats": [{"planet_id": 3}, {"planet_id": 4}],
+            "eliminations": [],
+        },
+        "victory": None,
+    }
+    for depth in range(5):
+        body = b"".join(iter_json(payload, depth))
+        assert json.loads(body) == json.loads(json.dumps(payload))
+
+
+def test_iter_json_splits_containers():
+    """Containers within depth are emitted as several fragments."""
+    fragments = list(iter_json({"items": [1, 2, 3]}, depth=2))
+    assert len(fragments) > 1
+    assert b"".join(fragments) == b'{"items":[1,2,3]}'
+
+
+def test_iter_json_streams_generators_as_lists():
+    """A generator is emitted as a JSON array, item by item."""
+    fragments = list(iter_json({"games": ({"id": i} for i in range(3))}, depth=2))
+    assert b"".join(fragments) == b'{"games":[{"id":0},{"id":1},{"id":2}]}'
+    assert b"".join(iter_json((i for i in range(2)), depth=0)) == b"[0,1]"
+
+
+def test_iter_chunks_groups_fragments():
+    """Fragments are joined into chunks of at least the given size."""
+    fragments = list(iter_json({"items": list(range(100))}, depth=2))
+    chunks = list(iter_chunks(fragments, size=50))
+    assert b"".join(chunks) == b"".join(fragments)
+    assert len(chunks) < len(fragments)
+    assert all(len(chunk) >= 50 for chunk in chunks[:-1])
+
+
+def test_jsonify_uses_orjson_provider(app):
+    """jsonify output keeps Flask's format (HTTP dates) without sorting keys."""
+    with app.test_request_context():
+        response = app.json.response({"b": 1, "a": datetime(2025, 1, 1), 3: None})
+    assert response.mimetype == "application/json"
+    assert response.get_data() == b'{"b":1,"a":"Wed, 01 Jan 2025 00:00:00 GMT","3":null}\n'
+
+
+def test_request_json_is_parsed_by_orjson(app):
+    """request.get_json() decodes through the provider's orjson loads."""
+    assert app.json.loads(b'{"a":[1,2.5]}') == {"a": [1, 2.5]}
+    with app.test_request_context(data=b'{"name":"\xc3\xa9"}', content_type="application/json"):
+        assert request.get_json() == {"name": "é"}
+
+
+def test_jsonify_is_compact_in_debug(app):
+    """Responses are never pretty-printed, even with debug on."""
+    app.debug = True
+    with app.test_request_context():
+        response = app.json.response({"a": [1, 2]})
+    assert response.get_data() == b'{"a":[1,2]}\n'
+
+
+def test_orjson_provider_can_sort_keys(app):
+    """Setting sort_keys restores Flask's sorted output."""
+    app.json.sort_keys = True
+    assert app.json.dumps({"b": 1, 3: None}) == '{"3":null,"b":1}'
+
+
+def test_orjson_codec_matches_stdlib_compact_output():
+    """Socket.IO packets encode like json.dumps(separators=(",", ":"))."""
+    payload = {"event": "turn", "players": {1: "ok"}, "name": "é"}
+    encoded = ORJSONCodec.dumps(payload, separators=(",", ":"))
+    assert json.loads(encoded) == json.loads(json.dumps(payload))
+    assert ORJSONCodec.loads(encoded) == {"event": "turn", "players": {"1": "ok"}, "name": "é"}
+
+
+def test_make_json_response_accepts_data_or_bytes():
+    """Dicts are encoded once; pre-encoded bytes are sent as is."""
+    response = make_json_response({"games": [], 1: True}, 201)
+    assert response.status_code == 201
+    assert response.mimetype == "application/json"
+    assert response.get_data() == b'{"games":[],"1":true}'
+    assert make_json_response(b'{"cached":1}').get_data() == b'{"cached":1}'
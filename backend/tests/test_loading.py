@@ -0,0 +1,211 @@
+"""
+Eager loading regression tests
+
+The testing config enables STRICT_LOADING, so a lazy load in a route query
+raises instead of silently issuing one query per row. These tests also
+check that the number of statements does not grow with the data.
+"""
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app import db
+from app.models import (
+    Fleet, Galaxy, Game, GamePlayer, Planet, PlayerTechnology, ProductionQueue, Ship, ShipDesign, User,
+)
+from app.services.auth import create_access_token
+from app.services.economy import EconomyService
+
+
+@contextmanager
+def count_queries():
+    """Collect the SQL statements emitted inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def make_planet_with_fleets(fleet_count: int, ships_per_fleet: int):
+    """Create a player owning a planet with stationed fleets; return (headers, planet_id)."""
+    user = User(email=f"loading{fleet_count}@test.com", pseudo="Loader")
+    db.session.add(user)
+    db.session.flush()
+
+    game = Game(name="Loading", admin_user_id=user.id)
+    db.session.add(game)
+    db.session.flush()
+
+    player = GamePlayer(game_id=game.id, user_id=user.id, player_name="Loader", color="#FF0000")
+    galaxy = Galaxy(game_id=game.id)
+    db.session.add_all([player, galaxy])
+    db.session.flush()
+
+    planet = Planet(
+        galaxy_id=galaxy.id, name="Home", x=0, y=0,
+        temperature=22, gravity=1.0, current_temperature=22, owner_id=player.id,
+    )
+    designs = [
+        ShipDesign(player_id=player.id, name="Fighter", ship_type="fighter"),
+        ShipDesign(player_id=player.id, name="Scout", ship_type="scout"),
+    ]
+    db.session.add(planet)
+    db.session.add_all(designs)
+    db.session.flush()
+
+    for index in range(fleet_count):
+        fleet = Fleet(player_id=player.id, name=f"Fleet {index}", current_planet_id=planet.id)
+        db.session.add(fleet)
+        for ship_index in range(ships_per_fleet):
+            db.session.add(Ship(design=designs[ship_index % len(designs)], fleet=fleet))
+
+    db.session.commit()
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}, planet.id
+
+
+def test_ships_detailed_query_count_is_constant(client):
+    """Listing 3 fleets of 10 ships costs as many queries as 1 fleet of 1 ship."""
+    headers, planet_id = make_planet_with_fleets(1, 1)
+    with count_queries() as small:
+        response = client.get(f"/api/planets/{planet_id}/ships-detailed", headers=headers)
+    assert response.status_code == 200
+    assert len(response.get_json()["ships"]) == 1
+
+    headers, planet_id = make_planet_with_fleets(3, 10)
+    with count_queries() as large:
+        response = client.get(f"/api/planets/{planet_id}/ships-detailed", headers=headers)
+    assert response.status_code == 200
+    assert len(response.get_json()["ships"]) == 30
+
+    assert len(large) == len(small)
+
+
+def test_game_map_query_count_is_constant(client):
+    """The map of 3 fleets of 10 ships costs as many queries as 1 fleet of 1 ship."""
+    counts = []
+    for fleet_count, ships_per_fleet in ((1, 1), (3, 10)):
+        headers, planet_id = make_planet_with_fleets(fleet_count, ships_per_fleet)
+        game = db.session.get(Planet, planet_id).galaxy.game
+        game.status = "running"
+        db.session.commit()
+        game_id = game.id
+        db.session.expunge_all()
+
+        with count_queries() as statements:
+            response = client.get(f"/api/games/{game_id}/map", headers=headers)
+        assert response.status_code == 200
+        assert sum(fleet["ship_count"] for fleet in response.get_json()["fleets"]) == fleet_count * ships_per_fleet
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+
+
+def test_planet_dicts_for_galaxy_match_to_dict(app):
+    """The row-based planet serializer gives the same output as to_dict()."""
+    _, planet_id = make_planet_with_fleets(0, 0)
+    planet = db.session.get(Planet, planet_id)
+    planet.current_temperature = 35.5
+    db.session.commit()
+
+    assert Planet.dicts_for_galaxy(planet.galaxy_id) == [planet.to_dict()]
+
+
+def make_game_with_players(player_count: int):
+    """Create a running game whose players all have technology; return (headers, game_id)."""
+    users = [User(email=f"tech{player_count}-{index}@test.com", pseudo=f"Tech{index}") for index in range(player_count)]
+    db.session.add_all(users)
+    db.session.flush()
+
+    game = Game(name="Technology", admin_user_id=users[0].id, status="running")
+    db.session.add(game)
+    db.session.flush()
+
+    for index, user in enumerate(users):
+        player = GamePlayer(game_id=game.id, user_id=user.id, player_name=user.pseudo, color="#00FF00")
+        db.session.add(player)
+        db.session.flush()
+        db.session.add(PlayerTechnology(player_id=player.id, weapons_level=index + 1))
+
+    db.session.commit()
+    return {"Authorization": f"Bearer {create_access_token(users[0].id)}"}, game.id
+
+
+def test_technology_comparison_query_count_is_constant(client):
+    """Comparing with 5 opponents costs as many queries as with 1."""
+    counts = []
+    for player_count in (2, 6):
+        headers, game_id = make_game_with_players(player_count)
+        db.session.expunge_all()
+
+        with count_queries() as statements:
+            response = client.get(f"/api/games/{game_id}/technology/comparison", headers=headers)
+        assert response.status_code == 200
+        assert len(response.get_json()["opponents"]) == player_count - 1
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+
+
+def test_technology_read_does_not_commit(client):
+    """Reading existing technology is a pure read: no COMMIT is sent."""
+    headers, game_id = make_game_with_players(2)
+    db.session.expunge_all()
+
+    commits = []
+    listener = lambda conn: commits.append(conn)  # noqa: E731
+    event.listen(db.engine, "commit", listener)
+    try:
+        response = client.get(f"/api/games/{game_id}/technology", headers=headers)
+    finally:
+        event.remove(db.engine, "commit", listener)
+
+    assert response.status_code == 200
+    assert response.get_json()["levels"]["weapons"] == 1
+    assert commits == []
+
+
+def test_budget_update_does_not_reload_after_commit(client):
+    """The budget PATCH answers from the updated row: no SELECT follows the UPDATE."""
+    headers, game_id = make_game_with_players(2)
+    db.session.expunge_all()
+
+    budget = {"range": 50, "speed": 10, "weapons": 10, "shields": 10, "mini": 10, "radical": 10}
+    with count_queries() as statements:
+        response = client.patch(
+            f"/api/games/{game_id}/technology/budget",
+            headers=headers,
+            json={f"{domain}_budget": value for domain, value in budget.items()},
+        )
+    assert response.status_code == 200
+    assert response.get_json()["budget"] == budget
+
+    update = next(i for i, statement in enumerate(statements) if statement.startswith("UPDATE"))
+    assert not any(statement.startswith("SELECT") for statement in statements[update:])
+
+
+def test_ship_production_loads_pending_queue_items_only(app):
+    """Completed queue items stay unloaded: by planet loads and by turn production."""
+    _, planet_id = make_planet_with_fleets(0, 0)
+    planet = db.session.get(Planet, planet_id)
+    planet.state = "colonized"
+    design = ShipDesign.query.filter_by(player_id=planet.owner_id).first()
+    for priority in range(5):
+        db.session.add(ProductionQueue(
+            planet_id=planet_id, design_id=design.id, priority=priority, is_completed=priority < 3,
+        ))
+    db.session.commit()
+    player_id = planet.owner_id
+    db.session.expunge_all()
+
+    assert "production_queue" not in db.session.get(Planet, planet_id).__dict__
+
+    player = db.session.get(GamePlayer, player_id)
+    EconomyService.process_player_ship_production(player)
+    planet = db.session.get(Planet, planet_id)
+    assert [item.priority for item in planet.__dict__["production_queue"]] == [3, 4]
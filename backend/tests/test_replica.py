@@ -0,0 +1,46 @@
+"""
+Read replica routing tests
+"""
+import pytest
+
+from app import create_app, db
+from app.config import TestingConfig
+from app.models import Game, User
+from app.services.auth import create_access_token
+from app.utils.replica import READ_REPLICA_BIND, read_replica
+
+
+@pytest.fixture
+def replica_app(monkeypatch):
+    """Application with an empty in-memory database as read replica."""
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_BINDS", {READ_REPLICA_BIND: "sqlite:///:memory:"}, raising=False)
+    app = create_app("testing")
+
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines[READ_REPLICA_BIND])
+        yield app
+        db.drop_all()
+
+
+def test_reads_go_to_replica_only_inside_block(replica_app):
+    """get_bind picks the replica for reads in read_replica(), the primary otherwise."""
+    replica, primary = db.engines[READ_REPLICA_BIND], db.engines[None]
+    assert db.session.get_bind(Game) is primary
+    with read_replica():
+        assert db.session.get_bind(Game) is replica
+    assert db.session.get_bind(Game) is primary
+
+
+def test_list_games_reads_from_replica(replica_app):
+    """A game only written to the primary is not listed until replicated."""
+    user = User(email="replica@test.com", pseudo="Replica")
+    db.session.add(user)
+    db.session.flush()
+    db.session.add(Game(name="Primary only", admin_user_id=user.id))
+    db.session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+    response = replica_app.test_client().get("/api/games", headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()["games"] == []